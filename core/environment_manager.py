@@ -5,6 +5,8 @@ from typing import Dict, Any, Optional
 import os
 from ..config import ConfigManager
 
+_MISSING = object()
+
 class EnvironmentManager:
     def __init__(self):
         """Initialize environment manager."""
@@ -17,6 +19,13 @@ class EnvironmentManager:
         }
         self.current_env = None
         self.config = None
+        # Single-entry memo for get_config: most callers hit the same key
+        # repeatedly, so one slot beats a full cache. Bumping _cfg_version
+        # invalidates it whenever the config changes.
+        self._cfg_version = 0
+        self._last_key: Optional[str] = None
+        self._last_value: Any = _MISSING
+        self._last_version = -1
         self._load_environment()
         
     def _load_environment(self):
@@ -36,6 +45,7 @@ class EnvironmentManager:
                 
             with open(config_path, 'r') as f:
                 self.config = yaml.safe_load(f)
+            self._cfg_version += 1
                 
             self.logger.info(f"Loaded environment: {env}")
             
@@ -52,6 +62,10 @@ class EnvironmentManager:
         Returns:
             Configuration value or default
         """
+        if key == self._last_key and self._last_version == self._cfg_version:
+            value = self._last_value
+            return default if value is _MISSING else value
+            
         try:
             if not self.config:
                 return default
@@ -63,9 +77,13 @@ class EnvironmentManager:
                 if isinstance(value, dict) and k in value:
                     value = value[k]
                 else:
-                    return default
+                    value = _MISSING
+                    break
                     
-            return value
+            self._last_key = key
+            self._last_value = value
+            self._last_version = self._cfg_version
+            return default if value is _MISSING else value
             
         except Exception as e:
             self.logger.error(f"Failed to get config {key}: {str(e)}")
@@ -94,6 +112,7 @@ class EnvironmentManager:
                 current = current[k]
                 
             current[keys[-1]] = value
+            self._cfg_version += 1
             
             # Save updated config
             self._save_config()
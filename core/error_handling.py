@@ -1,4 +1,5 @@
 import logging
+import sys
 import traceback
 from typing import Optional, Dict, Any
 import json
@@ -152,15 +153,36 @@ class ErrorReporter:
     def __init__(self):
         self.error_handler = ErrorHandler()
         
-    def report_to_sentry(self, error: Exception):
-        """Report error to Sentry."""
+        # Resolve the SDKs once; datadog.initialize() is one-shot setup and
+        # must not be repeated for every reported error.
         try:
             import sentry_sdk
-            sentry_sdk.capture_exception(error)
+            self._sentry = sentry_sdk
+        except ImportError:
+            self._sentry = None
+            
+        try:
+            from datadog import initialize, statsd
+            initialize()
+            self._statsd = statsd
         except ImportError:
+            self._statsd = None
+        except Exception as e:
+            self._statsd = None
+            self.error_handler.handle_error(
+                SystemError(f"Failed to initialize Datadog: {str(e)}", "SDK_ERROR")
+            )
+        
+    def report_to_sentry(self, error: Exception):
+        """Report error to Sentry."""
+        if self._sentry is None:
             self.error_handler.handle_error(
                 SystemError("Sentry SDK not installed", "SDK_ERROR")
             )
+            return
+            
+        try:
+            self._sentry.capture_exception(error)
         except Exception as e:
             self.error_handler.handle_error(
                 SystemError(f"Failed to report to Sentry: {str(e)}", "REPORT_ERROR")
@@ -168,14 +190,14 @@ class ErrorReporter:
 
     def report_to_datadog(self, error: Exception):
         """Report error to Datadog."""
-        try:
-            from datadog import initialize, statsd
-            initialize()
-            statsd.increment('orchestratex.errors.total')
-        except ImportError:
+        if self._statsd is None:
             self.error_handler.handle_error(
-                SystemError("Datadog SDK not installed", "SDK_ERROR")
+                SystemError("Datadog SDK not installed or failed to initialize", "SDK_ERROR")
             )
+            return
+            
+        try:
+            self._statsd.increment('orchestratex.errors.total')
         except Exception as e:
             self.error_handler.handle_error(
                 SystemError(f"Failed to report to Datadog: {str(e)}", "REPORT_ERROR")
@@ -0,0 +1,64 @@
+import json
+import os
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Serializers return bytes so callers issue a single write; json.dump
+# instead streams many small writes per key/value (see cpython PR #129770).
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+def dumps_compact(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes for machine-read-only payloads."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+def dumps_line(obj: Any) -> bytes:
+    """Serialize to a single compact JSON line."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8") + b"\n"
+
+def loads(data: bytes) -> Any:
+    """Deserialize JSON bytes, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def write_atomic(path: str, data: bytes, temp_file: Optional[str] = None):
+    """Durably replace path with data via fsync + os.replace.
+    
+    The temp file lives next to the target so the rename stays on one
+    filesystem, and the parent directory is fsynced so the rename itself
+    survives a crash.
+    
+    Args:
+        path: File to replace
+        data: New contents
+        temp_file: Temp file path; defaults to a hidden file beside path
+    """
+    path = os.fspath(path)
+    directory = os.path.dirname(path) or "."
+    if temp_file is None:
+        temp_file = os.path.join(directory, f".{os.path.basename(path)}.tmp")
+    with open(temp_file, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_file, path)
+    
+    if hasattr(os, "O_DIRECTORY"):  # directories can't be opened on Windows
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
@@ -2,10 +2,10 @@ import logging
 import json
 import os
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import hashlib
 import shutil
-import tempfile
+from .json_io import write_atomic
 
 class ProgressManager:
     def __init__(self, save_dir: str = "data/progress"):
@@ -16,6 +16,7 @@ class ProgressManager:
         """
         self.logger = logging.getLogger(__name__)
         self.save_dir = save_dir
+        self._backup_dir = os.path.join(save_dir, "backups")
         self._ensure_save_dir()
         self.progress = self._load_progress()
         
@@ -27,9 +28,9 @@ class ProgressManager:
         """Load progress from file."""
         try:
             progress_file = os.path.join(self.save_dir, "progress.json")
-            if os.path.exists(progress_file):
-                with open(progress_file, 'r') as f:
-                    return json.load(f)
+            with open(progress_file, 'rb') as f:
+                return json.loads(f.read())
+        except FileNotFoundError:
             return self._initialize_default_progress()
         except Exception as e:
             self.logger.error(f"Failed to load progress: {str(e)}")
@@ -61,14 +62,7 @@ class ProgressManager:
             
             # Save progress
             progress_file = os.path.join(self.save_dir, "progress.json")
-            temp_file = os.path.join(tempfile.gettempdir(), "orchestratex_progress.json")
-            
-            # Write to temp file first
-            with open(temp_file, 'w') as f:
-                json.dump(self.progress, f, indent=2)
-            
-            # Atomically replace the main file
-            shutil.move(temp_file, progress_file)
+            write_atomic(progress_file, json.dumps(self.progress, indent=2).encode("utf-8"))
             
             # Update last save time
             self.progress["last_save"] = datetime.now().isoformat()
@@ -83,7 +77,7 @@ class ProgressManager:
     def _create_backup(self):
         """Create a backup of the current progress."""
         try:
-            backup_dir = os.path.join(self.save_dir, "backups")
+            backup_dir = self._backup_dir
             os.makedirs(backup_dir, exist_ok=True)
             
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -104,8 +98,10 @@ class ProgressManager:
             if len(self.progress["backup_history"]) > 10:
                 oldest_backup = self.progress["backup_history"][0]
                 oldest_file = os.path.join(backup_dir, oldest_backup["file"])
-                if os.path.exists(oldest_file):
+                try:
                     os.remove(oldest_file)
+                except FileNotFoundError:
+                    pass
                 self.progress["backup_history"] = self.progress["backup_history"][1:]
                 
         except Exception as e:
@@ -121,7 +117,7 @@ class ProgressManager:
             True if restore was successful
         """
         try:
-            backup_dir = os.path.join(self.save_dir, "backups")
+            backup_dir = self._backup_dir
             
             if backup_id:
                 # Restore specific backup
@@ -158,17 +154,21 @@ class ProgressManager:
             List of backup information
         """
         try:
-            backup_dir = os.path.join(self.save_dir, "backups")
+            if not os.path.isdir(self._backup_dir):
+                return []
+                
+            # One directory scan instead of exists+stat per history entry
+            with os.scandir(self._backup_dir) as it:
+                entries = {e.name: e for e in it if e.is_file()}
             backups = []
             
             for backup in self.progress["backup_history"]:
-                backup_file = os.path.join(backup_dir, backup["file"])
-                if os.path.exists(backup_file):
-                    stat = os.stat(backup_file)
+                entry = entries.get(backup["file"])
+                if entry is not None:
                     backups.append({
                         "id": backup["timestamp"],
                         "file": backup["file"],
-                        "size": stat.st_size,
+                        "size": entry.stat().st_size,
                         "timestamp": backup["timestamp"]
                     })
             
@@ -186,14 +186,17 @@ class ProgressManager:
         """
         try:
             progress_file = os.path.join(self.save_dir, "progress.json")
-            if not os.path.exists(progress_file):
+            
+            # Calculate checksum, streaming the file through OpenSSL's
+            # SHA-256 where hashlib.file_digest exists (Python 3.11+)
+            try:
+                with open(progress_file, 'rb') as f:
+                    if hasattr(hashlib, "file_digest"):
+                        checksum = hashlib.file_digest(f, "sha256").hexdigest()
+                    else:
+                        checksum = hashlib.sha256(f.read()).hexdigest()
+            except FileNotFoundError:
                 return False
-                
-            with open(progress_file, 'rb') as f:
-                data = f.read()
-                
-            # Calculate checksum
-            checksum = hashlib.sha256(data).hexdigest()
             
             # Verify checksum
             if checksum != self.progress.get("checksum", ""):
@@ -1,13 +1,64 @@
 import logging
-import json
+from contextlib import contextmanager
+from functools import cached_property
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import os
 import hashlib
 import shutil
-from pathlib import Path
+from .json_io import dumps, dumps_line, loads, write_atomic
+
+_sha256 = hashlib.sha256
+
+def _short_id(prefix: str, name: str) -> str:
+    """Derive a stable 8-hex-digit ID from a name.
+    
+    IDs are the first 8 hex digits of the name's SHA-256. They double as
+    project directory names and component keys, so re-adding an existing
+    name must map back to the same ID; do not change the digest.
+    """
+    return f"{prefix}_{_sha256(name.encode()).hexdigest()[:8]}"
+
+def _set_pointer(doc: Any, pointer: str, value: Any):
+    """Set the value at an RFC 6901 JSON pointer, in place.
+    
+    Args:
+        doc: Document to modify
+        pointer: JSON pointer such as "/metadata/owner" or "/tags/0"
+        value: Value to store
+    """
+    if not pointer.startswith("/"):
+        raise ValueError(f"Invalid JSON pointer: {pointer!r}")
+        
+    tokens = [t.replace("~1", "/").replace("~0", "~") for t in pointer[1:].split("/")]
+    target = doc
+    for token in tokens[:-1]:
+        target = target[int(token)] if isinstance(target, list) else target[token]
+        
+    last = tokens[-1]
+    if isinstance(target, list):
+        if last == "-":
+            target.append(value)
+        else:
+            target[int(last)] = value
+    else:
+        target[last] = value
+
+_PROJECT_SUBDIRS = ("src", "tests", "docs", "data", "temp")
+_REQUIREMENTS_BYTES = b"# Project dependencies\n"
+_GITIGNORE_BYTES = b"\n".join([
+    b"__pycache__/*",
+    b"*.pyc",
+    b".env",
+    b"*.log",
+    b"data/*",
+    b"temp/*"
+])
 
 class ProjectManager:
+    # Deltas appended to the journal before it is folded into projects.json
+    JOURNAL_COMPACT_THRESHOLD = 1000
+    
     def __init__(self, projects_dir: str = "projects"):
         """Initialize project manager.
         
@@ -16,8 +67,24 @@ class ProjectManager:
         """
         self.logger = logging.getLogger(__name__)
         self.projects_dir = projects_dir
+        self._dirty = False
+        self._buffer_depth = 0
+        self._projects_file = os.path.join(projects_dir, "projects.json")
+        self._temp_file = os.path.join(projects_dir, ".projects.json.tmp")
+        self._journal_path = os.path.join(projects_dir, "projects.journal.jsonl")
+        self._journal_lines = 0
+        # Bumped on every mutation so readers can reuse derived views
+        self._projects_version = 0
+        self._list_cache: Optional[Tuple[int, Tuple[Dict[str, Any], ...]]] = None
+        self._component_arrays: Dict[str, Tuple[int, Dict[str, List[Any]]]] = {}
+        self._disk_stamp: Optional[Tuple[int, int]] = None
         self._ensure_projects_dir()
-        self.projects = self._load_projects()
+        
+    @cached_property
+    def projects(self) -> Dict[str, Any]:
+        """Project catalog, loaded from disk on first access."""
+        self._disk_stamp = self._read_disk_stamp()
+        return self._load_projects()
         
     def _ensure_projects_dir(self):
         """Ensure projects directory exists."""
@@ -26,15 +93,58 @@ class ProjectManager:
     def _load_projects(self) -> Dict[str, Any]:
         """Load projects from file."""
         try:
-            projects_file = os.path.join(self.projects_dir, "projects.json")
-            if os.path.exists(projects_file):
-                with open(projects_file, 'r') as f:
-                    return json.load(f)
-            return self._initialize_default_projects()
+            try:
+                with open(self._projects_file, 'rb') as f:
+                    projects = loads(f.read())
+            except FileNotFoundError:
+                projects = self._initialize_default_projects()
+            self._replay_journal(projects)
+            return projects
         except Exception as e:
             self.logger.error(f"Failed to load projects: {str(e)}")
             return self._initialize_default_projects()
             
+    def _replay_journal(self, projects: Dict[str, Any]):
+        """Apply journaled deltas on top of the loaded snapshot.
+        
+        Args:
+            projects: Snapshot loaded from projects.json
+        """
+        try:
+            with open(self._journal_path, 'rb') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return
+            
+        for line in lines:
+            try:
+                entry = loads(line)
+            except ValueError:
+                # Torn trailing write from an interrupted append
+                self.logger.warning("Skipping unreadable project journal entry")
+                continue
+                
+            payload = entry["payload"]
+            project = projects["projects"].get(payload["project_id"])
+            if project is None:
+                continue
+                
+            op = entry["op"]
+            if op == "update_project":
+                project.update(payload["updates"])
+                project["updated_at"] = payload["updated_at"]
+            elif op == "add_component":
+                project["components"][payload["component_id"]] = payload["component"]
+                project["progress"] = payload["progress"]
+            elif op == "mark_component_complete":
+                project["components"][payload["component_id"]]["status"] = "complete"
+                project["progress"] = payload["progress"]
+            elif op == "apply_patch":
+                _set_pointer(project, payload["path"], payload["value"])
+                project["updated_at"] = payload["updated_at"]
+                
+        self._journal_lines = len(lines)
+            
     def _initialize_default_projects(self) -> Dict[str, Any]:
         """Initialize default projects structure."""
         return {
@@ -55,19 +165,20 @@ class ProjectManager:
         """
         try:
             # Generate project ID
-            project_id = f"project_{hashlib.sha256(name.encode()).hexdigest()[:8]}"
+            project_id = _short_id("project", name)
             
             # Create project directory
-            project_dir = os.path.join(self.projects_dir, project_id)
+            project_dir = f"{self.projects_dir}/{project_id}"
             os.makedirs(project_dir)
             
             # Create project structure
+            now_iso = datetime.now().isoformat()
             project_data = {
                 "id": project_id,
                 "name": name,
                 "description": description,
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat(),
+                "created_at": now_iso,
+                "updated_at": now_iso,
                 "status": "active",
                 "components": {},
                 "dependencies": {},
@@ -84,7 +195,7 @@ class ProjectManager:
             
             # Add to projects
             self.projects["projects"][project_id] = project_data
-            self._save_projects()
+            self._mark_dirty()
             
             self.logger.info(f"Created project: {name}")
             return project_data
@@ -102,27 +213,22 @@ class ProjectManager:
         """
         try:
             # Create README
-            with open(os.path.join(project_dir, "README.md"), 'w') as f:
-                f.write(f"# {project_data['name']}\n\n{project_data['description']}")
+            readme = f"# {project_data['name']}\n\n{project_data['description']}"
+            with open(f"{project_dir}/README.md", 'wb') as f:
+                f.write(readme.encode("utf-8"))
             
             # Create requirements file
-            with open(os.path.join(project_dir, "requirements.txt"), 'w') as f:
-                f.write("# Project dependencies\n")
+            with open(f"{project_dir}/requirements.txt", 'wb') as f:
+                f.write(_REQUIREMENTS_BYTES)
             
             # Create gitignore
-            with open(os.path.join(project_dir, ".gitignore"), 'w') as f:
-                f.write("\n".join([
-                    "__pycache__/*",
-                    "*.pyc",
-                    ".env",
-                    "*.log",
-                    "data/*",
-                    "temp/*"
-                ]))
+            with open(f"{project_dir}/.gitignore", 'wb') as f:
+                f.write(_GITIGNORE_BYTES)
             
-            # Create project structure
-            for dir_name in ["src", "tests", "docs", "data", "temp"]:
-                os.makedirs(os.path.join(project_dir, dir_name))
+            # Create project structure; project_dir already exists, so a
+            # plain mkdir avoids makedirs' per-call parent checks
+            for dir_name in _PROJECT_SUBDIRS:
+                os.mkdir(f"{project_dir}/{dir_name}")
                 
         except Exception as e:
             self.logger.error(f"Failed to create project files: {str(e)}")
@@ -131,20 +237,119 @@ class ProjectManager:
     def _save_projects(self):
         """Save projects to file."""
         try:
-            projects_file = os.path.join(self.projects_dir, "projects.json")
-            temp_file = os.path.join(self.projects_dir, "temp_projects.json")
-            
-            # Write to temp file first
-            with open(temp_file, 'w') as f:
-                json.dump(self.projects, f, indent=2)
+            # Write to temp file first, then atomically replace the main file
+            write_atomic(self._projects_file, dumps(self.projects), self._temp_file)
             
-            # Atomically replace the main file
-            shutil.move(temp_file, projects_file)
+            # The snapshot now includes every journaled delta
+            try:
+                os.remove(self._journal_path)
+            except FileNotFoundError:
+                pass
+            self._journal_lines = 0
+            self._disk_stamp = self._read_disk_stamp()
             
         except Exception as e:
             self.logger.error(f"Failed to save projects: {str(e)}")
             raise
             
+    def _append_delta(self, op: str, payload: Dict[str, Any], ts: Optional[str] = None):
+        """Journal a single-project change instead of rewriting the catalog.
+        
+        Inside buffered() the change is folded into the deferred full save.
+        Once the journal grows past JOURNAL_COMPACT_THRESHOLD entries it is
+        compacted into projects.json.
+        
+        Args:
+            op: Operation name
+            payload: Operation data needed to replay the change
+            ts: ISO timestamp of the change, if the caller already has one
+        """
+        self._projects_version += 1
+        if self._buffer_depth > 0:
+            self._dirty = True
+            return
+            
+        line = dumps_line({
+            "ts": ts or datetime.now().isoformat(),
+            "op": op,
+            "payload": payload
+        })
+        fd = os.open(self._journal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+            
+        self._journal_lines += 1
+        if self._journal_lines >= self.JOURNAL_COMPACT_THRESHOLD:
+            self._save_projects()
+        else:
+            self._disk_stamp = self._read_disk_stamp()
+            
+    def _read_disk_stamp(self) -> Tuple[int, int]:
+        """Get the modification times of the snapshot and journal.
+        
+        Returns:
+            (projects.json mtime_ns, journal mtime_ns), 0 for missing files
+        """
+        stamps = []
+        for path in (self._projects_file, self._journal_path):
+            try:
+                stamps.append(os.stat(path).st_mtime_ns)
+            except FileNotFoundError:
+                stamps.append(0)
+        return tuple(stamps)
+        
+    def refresh(self) -> bool:
+        """Reload projects if another process changed them on disk.
+        
+        Skipped while unsaved changes are pending (inside buffered()).
+        
+        Returns:
+            True if projects were reloaded
+        """
+        if self._dirty or self._buffer_depth > 0:
+            return False
+            
+        if "projects" not in self.__dict__:
+            # Not loaded yet; the first access reads the current state
+            return False
+            
+        stamp = self._read_disk_stamp()
+        if stamp == self._disk_stamp:
+            return False
+            
+        self._disk_stamp = stamp
+        self.projects = self._load_projects()
+        self._projects_version += 1
+        return True
+            
+    def _mark_dirty(self):
+        """Record a pending change and save unless inside buffered()."""
+        self._projects_version += 1
+        self._dirty = True
+        if self._buffer_depth == 0:
+            self._save_projects()
+            self._dirty = False
+            
+    @contextmanager
+    def buffered(self):
+        """Defer saving projects until the outermost block exits.
+        
+        Wrap bulk mutations (e.g. adding many components) in
+        ``with manager.buffered():`` so projects.json is rewritten once
+        instead of after every call.
+        """
+        self._buffer_depth += 1
+        try:
+            yield self
+        finally:
+            self._buffer_depth -= 1
+            if self._buffer_depth == 0 and self._dirty:
+                self._save_projects()
+                self._dirty = False
+                
     def get_project(self, project_id: str) -> Optional[Dict[str, Any]]:
         """Get project information.
         
@@ -171,15 +376,54 @@ class ProjectManager:
             if not project:
                 raise ValueError(f"Project {project_id} not found")
                 
+            now_iso = datetime.now().isoformat()
             project.update(updates)
-            project["updated_at"] = datetime.now().isoformat()
-            self._save_projects()
+            project["updated_at"] = now_iso
+            self._append_delta("update_project", {
+                "project_id": project_id,
+                "updates": updates,
+                "updated_at": now_iso
+            }, ts=now_iso)
             return True
             
         except Exception as e:
             self.logger.error(f"Failed to update project: {str(e)}")
             return False
             
+    def apply_patch(self, project_id: str, json_pointer: str, value: Any) -> bool:
+        """Replace a single nested value in a project.
+        
+        Only the pointer and value are journaled, so deep edits do not
+        carry the surrounding structure the way update_project does.
+        
+        Args:
+            project_id: Project ID
+            json_pointer: RFC 6901 pointer into the project, e.g. "/metadata/owner"
+            value: New value
+            
+        Returns:
+            True if the patch was applied
+        """
+        try:
+            project = self.get_project(project_id)
+            if not project:
+                raise ValueError(f"Project {project_id} not found")
+                
+            now_iso = datetime.now().isoformat()
+            _set_pointer(project, json_pointer, value)
+            project["updated_at"] = now_iso
+            self._append_delta("apply_patch", {
+                "project_id": project_id,
+                "path": json_pointer,
+                "value": value,
+                "updated_at": now_iso
+            }, ts=now_iso)
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to patch project: {str(e)}")
+            return False
+            
     def delete_project(self, project_id: str) -> bool:
         """Delete a project.
         
@@ -195,24 +439,88 @@ class ProjectManager:
                 del self.projects["projects"][project_id]
                 
             # Remove project directory
-            project_dir = os.path.join(self.projects_dir, project_id)
+            project_dir = f"{self.projects_dir}/{project_id}"
             if os.path.exists(project_dir):
                 shutil.rmtree(project_dir)
                 
-            self._save_projects()
+            self._mark_dirty()
             return True
             
         except Exception as e:
             self.logger.error(f"Failed to delete project: {str(e)}")
             return False
             
-    def list_projects(self) -> List[Dict[str, Any]]:
+    def list_projects(self) -> Tuple[Dict[str, Any], ...]:
         """List all projects.
         
+        The snapshot is cached until the next mutation or on-disk change,
+        so repeated calls (e.g. from dashboard refreshes) do not rebuild it.
+        
         Returns:
-            List of project information
+            Tuple of project information
         """
-        return list(self.projects["projects"].values())
+        self.refresh()
+        cache = self._list_cache
+        if cache is None or cache[0] != self._projects_version:
+            cache = (self._projects_version, tuple(self.projects["projects"].values()))
+            self._list_cache = cache
+        return cache[1]
+        
+    def get_project_summary(self, project_id: str) -> Optional[Dict[str, Any]]:
+        """Get project information without its components.
+        
+        Args:
+            project_id: Project ID
+            
+        Returns:
+            Project summary or None if not found
+        """
+        project = self.get_project(project_id)
+        if not project:
+            return None
+            
+        return {
+            "id": project["id"],
+            "name": project["name"],
+            "description": project["description"],
+            "status": project["status"],
+            "created_at": project["created_at"],
+            "updated_at": project["updated_at"],
+            "progress": project["progress"]
+        }
+        
+    def get_component_arrays(self, project_id: str) -> Optional[Dict[str, List[Any]]]:
+        """Get a project's components as parallel arrays.
+        
+        The struct-of-arrays view is rebuilt only after a mutation, so
+        renderers can hand the columns straight to charts and tables.
+        
+        Args:
+            project_id: Project ID
+            
+        Returns:
+            Dict of ids, names, statuses, completed flags and descriptions,
+            or None if the project is not found
+        """
+        project = self.get_project(project_id)
+        if not project:
+            return None
+            
+        cached = self._component_arrays.get(project_id)
+        if cached is not None and cached[0] == self._projects_version:
+            return cached[1]
+            
+        components = project["components"]
+        statuses = [c.get("status", "pending") for c in components.values()]
+        arrays = {
+            "ids": list(components),
+            "names": [c.get("name", "") for c in components.values()],
+            "statuses": statuses,
+            "completed": [1 if status == "complete" else 0 for status in statuses],
+            "descriptions": [c.get("description", "") for c in components.values()]
+        }
+        self._component_arrays[project_id] = (self._projects_version, arrays)
+        return arrays
         
     def add_component(self, project_id: str, component: Dict[str, Any]) -> bool:
         """Add a component to a project.
@@ -229,12 +537,17 @@ class ProjectManager:
             if not project:
                 raise ValueError(f"Project {project_id} not found")
                 
-            component_id = f"component_{hashlib.sha256(component['name'].encode()).hexdigest()[:8]}"
+            component_id = _short_id("component", component['name'])
             project["components"][component_id] = component
             
             # Update progress
             project["progress"]["total"] += 1
-            self._save_projects()
+            self._append_delta("add_component", {
+                "project_id": project_id,
+                "component_id": component_id,
+                "component": component,
+                "progress": project["progress"]
+            })
             return True
             
         except Exception as e:
@@ -265,7 +578,11 @@ class ProjectManager:
                 project["progress"]["completed"] / project["progress"]["total"] * 100
             )
             
-            self._save_projects()
+            self._append_delta("mark_component_complete", {
+                "project_id": project_id,
+                "component_id": component_id,
+                "progress": project["progress"]
+            })
             return True
             
         except Exception as e:
@@ -1,10 +1,14 @@
 import logging
 import os
-import json
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 import shutil
-import tempfile
+from .json_io import dumps, dumps_compact, loads, write_atomic
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 class RecoveryManager:
     def __init__(self, recovery_dir: str = "data/recovery"):
@@ -15,8 +19,17 @@ class RecoveryManager:
         """
         self.logger = logging.getLogger(__name__)
         self.recovery_dir = recovery_dir
+        self._recovery_file = os.path.join(recovery_dir, "recovery_points.json")
+        self._temp_file = os.path.join(recovery_dir, ".recovery_points.json.tmp")
+        self._compressor = zstandard.ZstdCompressor(level=3) if zstandard is not None else None
         self._ensure_recovery_dir()
         self.recovery_points = self._load_recovery_points()
+        # Keep points in ascending timestamp order; appends preserve it, so
+        # readers never need to sort (a no-op pass for well-formed files)
+        self.recovery_points["recovery_points"].sort(key=lambda x: x["timestamp"])
+        self._recovery_index: Dict[str, Dict[str, Any]] = {
+            point["id"]: point for point in self.recovery_points["recovery_points"]
+        }
         
     def _ensure_recovery_dir(self):
         """Ensure recovery directory exists."""
@@ -25,10 +38,9 @@ class RecoveryManager:
     def _load_recovery_points(self) -> Dict[str, Any]:
         """Load recovery points from file."""
         try:
-            recovery_file = os.path.join(self.recovery_dir, "recovery_points.json")
-            if os.path.exists(recovery_file):
-                with open(recovery_file, 'r') as f:
-                    return json.load(f)
+            with open(self._recovery_file, 'rb') as f:
+                return loads(f.read())
+        except FileNotFoundError:
             return self._initialize_default_recovery_points()
         except Exception as e:
             self.logger.error(f"Failed to load recovery points: {str(e)}")
@@ -55,23 +67,38 @@ class RecoveryManager:
         """
         try:
             # Create recovery point ID
-            recovery_id = f"recovery_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            now = datetime.now()
+            recovery_id = f"recovery_{now.strftime('%Y%m%d_%H%M%S')}"
             
             # Create recovery point directory
-            recovery_path = os.path.join(self.recovery_dir, recovery_id)
+            recovery_path = f"{self.recovery_dir}/{recovery_id}"
             os.makedirs(recovery_path)
             
             # Save recovery data
-            with open(os.path.join(recovery_path, "data.json"), 'w') as f:
-                json.dump(data, f, indent=2)
+            # Only restore_recovery_point reads this, so skip indentation
+            # and zstd-compress it when zstandard is installed
+            payload = dumps_compact(data)
+            data_file = "data.json"
+            if self._compressor is not None:
+                payload = self._compressor.compress(payload)
+                data_file = "data.json.zst"
+            with open(f"{recovery_path}/{data_file}", 'wb') as f:
+                f.write(payload)
             
             # Update recovery points
-            self.recovery_points["recovery_points"].append({
+            points = self.recovery_points["recovery_points"]
+            point = {
                 "id": recovery_id,
                 "description": description,
-                "timestamp": datetime.now().isoformat(),
-                "data_path": recovery_path
-            })
+                "timestamp": now.isoformat(),
+                "data_path": recovery_path,
+                "data_file": data_file
+            }
+            points.append(point)
+            self._recovery_index[recovery_id] = point
+            if len(points) > 1 and points[-2]["timestamp"] > point["timestamp"]:
+                # Wall clock stepped backwards; restore ordering
+                points.sort(key=lambda x: x["timestamp"])
             
             # Save recovery points
             self._save_recovery_points()
@@ -86,15 +113,8 @@ class RecoveryManager:
     def _save_recovery_points(self):
         """Save recovery points to file."""
         try:
-            recovery_file = os.path.join(self.recovery_dir, "recovery_points.json")
-            temp_file = os.path.join(tempfile.gettempdir(), "orchestratex_recovery.json")
-            
-            # Write to temp file first
-            with open(temp_file, 'w') as f:
-                json.dump(self.recovery_points, f, indent=2)
-            
-            # Atomically replace the main file
-            shutil.move(temp_file, recovery_file)
+            # Write to temp file first, then atomically replace the main file
+            write_atomic(self._recovery_file, dumps(self.recovery_points), self._temp_file)
             
         except Exception as e:
             self.logger.error(f"Failed to save recovery points: {str(e)}")
@@ -111,24 +131,25 @@ class RecoveryManager:
         """
         try:
             # Find recovery point
-            recovery_point = None
-            for point in self.recovery_points["recovery_points"]:
-                if point["id"] == recovery_id:
-                    recovery_point = point
-                    break
-            
+            recovery_point = self._recovery_index.get(recovery_id)
             if not recovery_point:
                 raise ValueError(f"Recovery point {recovery_id} not found")
                 
             # Load recovery data
             data_path = recovery_point["data_path"]
-            data_file = os.path.join(data_path, "data.json")
+            data_file = f"{data_path}/{recovery_point.get('data_file', 'data.json')}"
             
-            if not os.path.exists(data_file):
+            try:
+                with open(data_file, 'rb') as f:
+                    payload = f.read()
+            except FileNotFoundError:
                 raise FileNotFoundError(f"Recovery data not found: {data_file}")
                 
-            with open(data_file, 'r') as f:
-                recovery_data = json.load(f)
+            if data_file.endswith(".zst"):
+                if zstandard is None:
+                    raise RuntimeError(f"zstandard is required to read {data_file}")
+                payload = zstandard.ZstdDecompressor().decompress(payload)
+            recovery_data = loads(payload)
                 
             # Update recovery points
             self.recovery_points["last_recovery"] = datetime.now().isoformat()
@@ -148,11 +169,8 @@ class RecoveryManager:
             List of recovery points
         """
         try:
-            return sorted(
-                self.recovery_points["recovery_points"],
-                key=lambda x: x["timestamp"],
-                reverse=True
-            )
+            # Stored oldest first, so newest first is just a reversed copy
+            return list(reversed(self.recovery_points["recovery_points"]))
             
         except Exception as e:
             self.logger.error(f"Failed to get recovery points: {str(e)}")
@@ -215,20 +233,22 @@ class RecoveryManager:
             Number of recovery points cleaned up
         """
         try:
-            cleanup_count = 0
-            cutoff = datetime.now() - timedelta(days=days)
+            # ISO-8601 timestamps compare correctly as strings
+            cutoff_iso = (datetime.now() - timedelta(days=days)).isoformat()
             
-            # Clean up recovery points
+            # Partition in one pass rather than removing while iterating
+            keep = []
+            to_delete = []
             for point in self.recovery_points["recovery_points"]:
-                ts = datetime.fromisoformat(point["timestamp"])
-                if ts < cutoff:
-                    # Remove recovery directory
-                    if os.path.exists(point["data_path"]):
-                        shutil.rmtree(point["data_path"])
-                    
-                    # Remove from list
-                    self.recovery_points["recovery_points"].remove(point)
-                    cleanup_count += 1
+                (keep if point["timestamp"] >= cutoff_iso else to_delete).append(point)
+                
+            # Remove recovery directories
+            for point in to_delete:
+                shutil.rmtree(point["data_path"], ignore_errors=True)
+                self._recovery_index.pop(point["id"], None)
+                
+            self.recovery_points["recovery_points"] = keep
+            cleanup_count = len(to_delete)
                     
             # Save changes
             self._save_recovery_points()
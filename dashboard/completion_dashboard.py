@@ -1,14 +1,15 @@
 import logging
 import json
-from typing import Dict, Any, List
-import dash
-from dash import html, dcc, callback, Output, Input
-import plotly.graph_objects as go
+from functools import lru_cache
+from typing import Dict, Any, List, TYPE_CHECKING
 from datetime import datetime
 from ..core.project_manager import ProjectManager
 
+if TYPE_CHECKING:
+    import dash
+
 class CompletionDashboard:
-    def __init__(self, app: dash.Dash):
+    def __init__(self, app: "dash.Dash"):
         """Initialize completion dashboard.
         
         Args:
@@ -22,6 +23,10 @@ class CompletionDashboard:
         
     def _setup_layout(self):
         """Setup dashboard layout."""
+        # dash/plotly are imported here rather than at module level so
+        # importing this module (or ProjectManager) stays cheap
+        from dash import html, dcc
+        
         self.app.layout = html.Div([
             # Header
             html.H1("Orchestratex Project Completion Dashboard"),
@@ -62,6 +67,9 @@ class CompletionDashboard:
         
     def _setup_callbacks(self):
         """Setup dashboard callbacks."""
+        from dash import html, callback, Output, Input
+        import plotly.graph_objects as go
+        
         @callback(
             Output('project-selector', 'options'),
             Input('interval-component', 'n_intervals'),
@@ -75,34 +83,24 @@ class CompletionDashboard:
                 for p in projects
             ]
             
-        @callback(
-            Output('project-overview', 'children'),
-            Output('progress-chart', 'figure'),
-            Output('component-status', 'figure'),
-            Output('component-details', 'children'),
-            Input('project-selector', 'value'),
-            Input('interval-component', 'n_intervals'),
-            Input('refresh-btn', 'n_clicks')
-        )
-        def update_dashboard(project_id, n, n_clicks):
-            """Update dashboard content."""
-            if not project_id:
-                return "", {}, {}, ""
-                
-            project = self.project_manager.get_project(project_id)
-            if not project:
+        @lru_cache(maxsize=32)
+        def render_project(project_id, version):
+            """Render dashboard content for one version of a project."""
+            summary = self.project_manager.get_project_summary(project_id)
+            if not summary:
                 return "Project not found", {}, {}, ""
+            components = self.project_manager.get_component_arrays(project_id)
                 
             # Project overview
             overview = html.Div([
-                html.P(f"Name: {project['name']}")
-                html.P(f"Description: {project['description']}")
-                html.P(f"Created: {project['created_at']}")
-                html.P(f"Updated: {project['updated_at']}")
+                html.P(f"Name: {summary['name']}"),
+                html.P(f"Description: {summary['description']}"),
+                html.P(f"Created: {summary['created_at']}"),
+                html.P(f"Updated: {summary['updated_at']}")
             ])
             
             # Progress chart
-            progress = project['progress']
+            progress = summary['progress']
             progress_chart = go.Figure(
                 data=[
                     go.Pie(
@@ -121,9 +119,8 @@ class CompletionDashboard:
             component_status = go.Figure(
                 data=[
                     go.Bar(
-                        x=list(project['components'].keys()),
-                        y=[1 if c['status'] == 'complete' else 0 
-                          for c in project['components'].values()],
+                        x=components['ids'],
+                        y=components['completed'],
                         name='Completed'
                     )
                 ]
@@ -146,17 +143,39 @@ class CompletionDashboard:
                     ]),
                     html.Tbody([
                         html.Tr([
-                            html.Td(c['name']),
-                            html.Td(c['status']),
-                            html.Td(c['description'])
+                            html.Td(name),
+                            html.Td(status),
+                            html.Td(description)
                         ])
-                        for c in project['components'].values()
+                        for name, status, description in zip(
+                            components['names'],
+                            components['statuses'],
+                            components['descriptions']
+                        )
                     ])
                 ])
             ])
             
             return overview, progress_chart, component_status, component_details
             
+        @callback(
+            Output('project-overview', 'children'),
+            Output('progress-chart', 'figure'),
+            Output('component-status', 'figure'),
+            Output('component-details', 'children'),
+            Input('project-selector', 'value'),
+            Input('interval-component', 'n_intervals'),
+            Input('refresh-btn', 'n_clicks')
+        )
+        def update_dashboard(project_id, n, n_clicks):
+            """Update dashboard content."""
+            if not project_id:
+                return "", {}, {}, ""
+                
+            # Interval ticks on an unchanged project reuse the last render
+            self.project_manager.refresh()
+            return render_project(project_id, self.project_manager._projects_version)
+            
     def run(self, host: str = '0.0.0.0', port: int = 8050):
         """Run the dashboard.
         
@@ -2,10 +2,37 @@ import os
 import subprocess
 import sys
 import logging
+import logging.handlers
+import queue
+import atexit
+import argparse
+import hashlib
 from pathlib import Path
 import shutil
 import json
 
+# Smallest valid 1x1 grey images, so placeholder assets still decode
+_PLACEHOLDER_PNG = (
+    b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x00\x00\x00\x00:~\x9bU'
+    b'\x00\x00\x00\nIDATx\xdac\xf8\x0f\x00\x01\x01\x01\x00\x1c\xb0\x8c\x99'
+    b'\x00\x00\x00\x00IEND\xaeB`\x82'
+)
+_PLACEHOLDER_JPEG = (
+    b'\xff\xd8'                                                  # SOI
+    b'\xff\xdb\x00\x43\x00' + b'\x01' * 64 +                     # DQT, flat table
+    b'\xff\xc0\x00\x0b\x08\x00\x01\x00\x01\x01\x01\x11\x00'      # SOF0, 1x1, 1 component
+    b'\xff\xc4\x00\x14\x00\x01' + b'\x00' * 15 + b'\x00' +        # DHT, DC: one 1-bit code
+    b'\xff\xc4\x00\x14\x10\x01' + b'\x00' * 15 + b'\x00' +        # DHT, AC: one 1-bit code (EOB)
+    b'\xff\xda\x00\x08\x01\x01\x00\x00\x3f\x00'                   # SOS
+    b'\x3f'                                                      # DC diff 0, EOB
+    b'\xff\xd9'                                                  # EOI
+)
+_PLACEHOLDERS = {
+    ".png": _PLACEHOLDER_PNG,
+    ".jpg": _PLACEHOLDER_JPEG,
+    ".jpeg": _PLACEHOLDER_JPEG
+}
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -17,7 +44,15 @@ logging.basicConfig(
 )
 
 class OrchestratexDeployer:
-    def __init__(self):
+    def __init__(self, fast: bool = False, skip_tests: bool = False):
+        """Initialize the deployer.
+
+        Args:
+            fast: Skip steps whose results are already in place
+            skip_tests: Do not run the test suites
+        """
+        self.fast = fast
+        self.skip_tests = skip_tests or os.environ.get("SKIP_TESTS") == "1"
         self.config = {
             "project_name": "Orchestratex",
             "version": "1.0.0",
@@ -42,21 +77,29 @@ class OrchestratexDeployer:
         if sys.version_info < (3, 8):
             raise Exception("Python 3.8 or higher is required")
 
+        # List the project root once instead of stat-ing each entry
+        with os.scandir(".") as it:
+            present = {entry.name for entry in it}
+
         # Check required directories
         for dir_name in self.config["directories"].values():
-            if not os.path.exists(dir_name):
+            if dir_name not in present:
                 logging.info(f"Creating directory: {dir_name}")
-                os.makedirs(dir_name)
+                Path(dir_name).mkdir(exist_ok=True)
 
         # Check required files
-        for file in self.config["required_files"]:
-            if not os.path.exists(file):
-                raise Exception(f"Required file not found: {file}")
+        missing = [f for f in self.config["required_files"] if f not in present]
+        if missing:
+            raise Exception(f"Required file not found: {', '.join(missing)}")
 
     def setup_virtual_environment(self):
         """Set up virtual environment."""
         logging.info("Setting up virtual environment...")
         
+        if self.fast and self._venv_matches_interpreter():
+            logging.info("Virtual environment up to date, skipping")
+            return
+            
         # Create virtual environment
         if not os.path.exists("venv"):
             subprocess.run(["python", "-m", "venv", "venv"], check=True)
@@ -69,14 +112,50 @@ class OrchestratexDeployer:
             
         logging.info("Virtual environment activated")
 
+    def _venv_matches_interpreter(self) -> bool:
+        """Check whether venv/ was created for the running Python version."""
+        try:
+            with open(os.path.join("venv", "pyvenv.cfg")) as f:
+                for line in f:
+                    key, _, value = line.partition("=")
+                    if key.strip() in ("version", "version_info"):
+                        return value.strip().startswith(
+                            f"{sys.version_info.major}.{sys.version_info.minor}."
+                        )
+        except FileNotFoundError:
+            pass
+        return False
+
     def install_dependencies(self):
         """Install project dependencies."""
         logging.info("Installing dependencies...")
         
-        # Install requirements
-        subprocess.run([
-            "python", "-m", "pip", "install", "-r", "requirements.txt"
-        ], check=True)
+        with open("requirements.txt", "rb") as f:
+            req_hash = hashlib.blake2b(f.read()).hexdigest()
+        hash_file = Path("venv") / ".req_hash"
+        
+        if self.fast and hash_file.exists() and hash_file.read_text() == req_hash:
+            logging.info("requirements.txt unchanged, skipping install")
+            return
+            
+        # Install requirements; uv resolves and installs far faster than pip
+        # when present. pip is told to use wheels where it can, skip
+        # byte-compiling, and honour constraints.txt pins if the repo has one.
+        env = dict(os.environ)
+        env.setdefault("PIP_CACHE_DIR", str(Path.home() / ".cache" / "pip"))
+        if shutil.which("uv"):
+            cmd = ["uv", "pip", "install", "--python", "python", "-r", "requirements.txt"]
+        else:
+            cmd = [
+                "python", "-m", "pip", "install", "-r", "requirements.txt",
+                "--prefer-binary", "--no-compile"
+            ]
+            if os.path.exists("constraints.txt"):
+                cmd += ["-c", "constraints.txt"]
+        subprocess.run(cmd, check=True, env=env)
+        
+        if hash_file.parent.is_dir():
+            hash_file.write_text(req_hash)
 
     def setup_environment(self):
         """Set up environment variables."""
@@ -95,9 +174,8 @@ class OrchestratexDeployer:
                 "PINECONE_API_KEY": "your-pinecone-key"
             }
             
-            with open(".env", "w") as f:
-                for key, value in env_template.items():
-                    f.write(f"{key}={value}\n")
+            content = "\n".join(f"{key}={value}" for key, value in env_template.items()) + "\n"
+            Path(".env").write_text(content)
             
             logging.info("Created .env file with template values")
 
@@ -111,23 +189,37 @@ class OrchestratexDeployer:
             "logo.png"
         ]
         
-        # Create placeholder assets if they don't exist
-        for asset in required_assets:
+        # List the assets directory once and skip entirely if complete
+        with os.scandir(assets_dir) as it:
+            present = {entry.name for entry in it}
+        missing = [asset for asset in required_assets if asset not in present]
+        if not missing:
+            return
+            
+        # Create placeholder assets if they don't exist. Mode "x" creates
+        # atomically, so an asset that appeared since the scan is left alone.
+        for asset in missing:
             asset_path = assets_dir / asset
-            if not asset_path.exists():
-                logging.warning(f"Creating placeholder for: {asset}")
-                with open(asset_path, "w") as f:
-                    f.write("Placeholder file")
+            logging.warning(f"Creating placeholder for: {asset}")
+            try:
+                with open(asset_path, "xb") as f:
+                    f.write(_PLACEHOLDERS.get(asset_path.suffix.lower(), b""))
+            except FileExistsError:
+                pass
 
     def run_tests(self):
         """Run unit and integration tests."""
+        if self.skip_tests:
+            logging.info("Skipping tests")
+            return
+            
         logging.info("Running tests...")
         
-        # Run unit tests
-        subprocess.run(["python", "-m", "pytest", "tests/"], check=True)
-        
-        # Run integration tests
-        subprocess.run(["python", "-m", "pytest", "tests/integration/"], check=True)
+        # Run unit and integration tests (tests/integration/ lives under
+        # tests/) in one pytest process, sharded across cores by
+        # pytest-xdist; PYTEST_WORKERS caps the worker count
+        workers = os.environ.get("PYTEST_WORKERS", "auto")
+        subprocess.run(["python", "-m", "pytest", "-n", workers, "tests/"], check=True)
 
     def setup_logging(self):
         """Set up logging configuration."""
@@ -137,15 +229,36 @@ class OrchestratexDeployer:
         logs_dir = Path("logs")
         logs_dir.mkdir(exist_ok=True)
         
-        # Set up log rotation
+        # Set up log rotation. Records are handed to a queue and written by
+        # a background listener thread, so callers never block on disk.
         try:
-            import logging.handlers
+            root = logging.getLogger('')
             handler = logging.handlers.RotatingFileHandler(
                 'logs/app.log',
                 maxBytes=1024*1024,
-                backupCount=5
+                backupCount=5,
+                delay=True
+            )
+            handlers = list(root.handlers)
+            if handlers:
+                handler.setFormatter(handlers[0].formatter)
+            handlers.append(handler)
+            
+            log_queue = queue.Queue(-1)
+            self._log_listener = logging.handlers.QueueListener(
+                log_queue, *handlers, respect_handler_level=True
             )
-            logging.getLogger('').addHandler(handler)
+            for h in root.handlers[:]:
+                root.removeHandler(h)
+            root.addHandler(logging.handlers.QueueHandler(log_queue))
+            
+            # Skip per-record thread/process lookups nobody formats
+            logging.logThreads = False
+            logging.logProcesses = False
+            logging.raiseExceptions = False
+            
+            self._log_listener.start()
+            atexit.register(self._log_listener.stop)
         except Exception as e:
             logging.error(f"Failed to set up log rotation: {str(e)}")
 
@@ -170,5 +283,12 @@ class OrchestratexDeployer:
             raise
 
 if __name__ == "__main__":
-    deployer = OrchestratexDeployer()
+    parser = argparse.ArgumentParser(description="Deploy Orchestratex")
+    parser.add_argument("--fast", action="store_true",
+                        help="skip steps whose results are already in place")
+    parser.add_argument("--skip-tests", action="store_true",
+                        help="do not run the test suites (or set SKIP_TESTS=1)")
+    args = parser.parse_args()
+    
+    deployer = OrchestratexDeployer(fast=args.fast, skip_tests=args.skip_tests)
     deployer.deploy()
@@ -1,4 +1,7 @@
 import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 from kubernetes import client, config
 from kubernetes.client import V1ServiceAccount, V1Role, V1RoleBinding
 from kubernetes.client import V1Deployment, V1PodSpec, V1Container
@@ -6,6 +9,30 @@ from kubernetes.client import V1Service, V1Ingress
 
 logger = logging.getLogger(__name__)
 
+# Field manager recorded on objects written by server-side apply
+FIELD_MANAGER = "orchestratex"
+
+# kind -> (apiVersion, REST path prefix, plural) for server-side apply
+_APPLY_RESOURCES = {
+    "Namespace": ("v1", "/api/v1", "namespaces"),
+    "ServiceAccount": ("v1", "/api/v1", "serviceaccounts"),
+    "Role": ("rbac.authorization.k8s.io/v1", "/apis/rbac.authorization.k8s.io/v1", "roles"),
+    "RoleBinding": ("rbac.authorization.k8s.io/v1", "/apis/rbac.authorization.k8s.io/v1", "rolebindings"),
+    "Deployment": ("apps/v1", "/apis/apps/v1", "deployments"),
+    "Service": ("v1", "/api/v1", "services"),
+    "Ingress": ("networking.k8s.io/v1", "/apis/networking.k8s.io/v1", "ingresses")
+}
+
+@functools.lru_cache(maxsize=1)
+def _load_cluster_config():
+    """Load cluster credentials once per process."""
+    # Try in-cluster config first
+    try:
+        config.load_incluster_config()
+    except config.ConfigException:
+        # Fallback to local config
+        config.load_kube_config()
+
 class KubernetesClusterSetup:
     def __init__(self, config):
         """Initialize Kubernetes cluster setup.
@@ -15,25 +42,141 @@ class KubernetesClusterSetup:
         """
         self.config = config
         self.k8s_client = None
+        self.api_client = None
         self._initialize_client()
         
     def _initialize_client(self):
         """Initialize Kubernetes client."""
         try:
-            # Try in-cluster config first
-            try:
-                config.load_incluster_config()
-            except:
-                # Fallback to local config
-                config.load_kube_config()
-                
-            self.k8s_client = client.CoreV1Api()
+            _load_cluster_config()
+            # One ApiClient (and its connection pool) shared by every API group
+            self.api_client = client.ApiClient()
+            self.k8s_client = client.CoreV1Api(self.api_client)
+            self._apps_v1 = client.AppsV1Api(self.api_client)
+            self._rbac_v1 = client.RbacAuthorizationV1Api(self.api_client)
+            self._networking_v1 = client.NetworkingV1Api(self.api_client)
             logger.info("Kubernetes client initialized successfully")
             
         except Exception as e:
             logger.error(f"Failed to initialize Kubernetes client: {str(e)}")
             raise
             
+    def _namespace_obj(self, namespace: str) -> client.V1Namespace:
+        """Build a Namespace object."""
+        return client.V1Namespace(
+            metadata=client.V1ObjectMeta(name=namespace)
+        )
+        
+    def _service_account_obj(self, namespace: str, name: str) -> V1ServiceAccount:
+        """Build a ServiceAccount object."""
+        return V1ServiceAccount(
+            metadata=client.V1ObjectMeta(name=name, namespace=namespace)
+        )
+        
+    def _role_binding_obj(self, namespace: str, sa_name: str, role_name: str) -> V1RoleBinding:
+        """Build a RoleBinding granting role_name to a service account."""
+        return V1RoleBinding(
+            metadata=client.V1ObjectMeta(name=f"{sa_name}-binding", namespace=namespace),
+            subjects=[
+                client.V1Subject(
+                    kind="ServiceAccount",
+                    name=sa_name,
+                    namespace=namespace
+                )
+            ],
+            role_ref=client.V1RoleRef(
+                kind="Role",
+                name=role_name,
+                api_group="rbac.authorization.k8s.io"
+            )
+        )
+        
+    def apply(self, obj, kind: str):
+        """Create or update an object with server-side apply.
+        
+        Args:
+            obj: Kubernetes model object
+            kind: Object kind, one of the keys of _APPLY_RESOURCES
+        """
+        api_version, prefix, plural = _APPLY_RESOURCES[kind]
+        body = self.api_client.sanitize_for_serialization(obj)
+        body["apiVersion"] = api_version
+        body["kind"] = kind
+        
+        metadata = body["metadata"]
+        if kind == "Namespace":
+            path = f"{prefix}/{plural}/{metadata['name']}"
+        else:
+            path = f"{prefix}/namespaces/{metadata['namespace']}/{plural}/{metadata['name']}"
+            
+        # The REST client JSON-encodes the dict for this content type, and
+        # JSON is valid YAML; pre-encoding it would send a quoted string
+        response = self.api_client.call_api(
+            path,
+            "PATCH",
+            query_params=[("fieldManager", FIELD_MANAGER), ("force", "true")],
+            header_params={
+                "Accept": "application/json",
+                "Content-Type": "application/apply-patch+yaml"
+            },
+            body=body,
+            auth_settings=["BearerToken"],
+            _preload_content=False
+        )
+        response[0].release_conn()
+        
+    def bootstrap(self,
+                  namespace: str,
+                  sa_name: str,
+                  role_name: str,
+                  deployments: Optional[List[V1Deployment]] = None,
+                  services: Optional[List[V1Service]] = None,
+                  ingresses: Optional[List[V1Ingress]] = None):
+        """Apply a namespace and everything in it with server-side apply.
+        
+        The namespace is applied first; the remaining objects are independent
+        and are applied concurrently over the shared connection pool. Apply is
+        idempotent, so bootstrap can be re-run against an existing namespace.
+        Deployments, services and ingresses are placed in namespace whatever
+        their metadata.namespace says.
+        
+        Args:
+            namespace: Namespace name
+            sa_name: Service account name
+            role_name: Role to bind to the service account
+            deployments: Deployment objects
+            services: Service objects
+            ingresses: Ingress objects
+        """
+        try:
+            self.apply(self._namespace_obj(namespace), "Namespace")
+            
+            objects = [
+                (self._service_account_obj(namespace, sa_name), "ServiceAccount"),
+                (self._role_binding_obj(namespace, sa_name, role_name), "RoleBinding")
+            ]
+            objects += [(d, "Deployment") for d in deployments or []]
+            objects += [(s, "Service") for s in services or []]
+            objects += [(i, "Ingress") for i in ingresses or []]
+            
+            # Everything lands in the bootstrapped namespace; apply() builds
+            # the URL from metadata.namespace, so it must be set
+            for obj, _ in objects:
+                if obj.metadata is None:
+                    obj.metadata = client.V1ObjectMeta()
+                obj.metadata.namespace = namespace
+                
+            
+            with ThreadPoolExecutor(max_workers=len(objects)) as pool:
+                # list() re-raises the first failure
+                list(pool.map(lambda item: self.apply(*item), objects))
+                
+            logger.info(f"Bootstrapped namespace {namespace} with {len(objects) + 1} objects")
+            
+        except Exception as e:
+            logger.error(f"Failed to bootstrap namespace {namespace}: {str(e)}")
+            raise
+            
     def create_namespace(self, namespace: str):
         """Create Kubernetes namespace.
         
@@ -41,11 +184,7 @@ class KubernetesClusterSetup:
             namespace: Namespace name
         """
         try:
-            v1 = client.CoreV1Api()
-            namespace_obj = client.V1Namespace(
-                metadata=client.V1ObjectMeta(name=namespace)
-            )
-            v1.create_namespace(namespace_obj)
+            self.k8s_client.create_namespace(self._namespace_obj(namespace))
             logger.info(f"Namespace {namespace} created successfully")
             
         except Exception as e:
@@ -60,11 +199,10 @@ class KubernetesClusterSetup:
             name: Service account name
         """
         try:
-            v1 = client.CoreV1Api()
-            sa = V1ServiceAccount(
-                metadata=client.V1ObjectMeta(name=name)
+            self.k8s_client.create_namespaced_service_account(
+                namespace,
+                self._service_account_obj(namespace, name)
             )
-            v1.create_namespaced_service_account(namespace, sa)
             logger.info(f"Service account {name} created in {namespace}")
             
         except Exception as e:
@@ -80,23 +218,10 @@ class KubernetesClusterSetup:
             role_name: Role name
         """
         try:
-            rbac = client.RbacAuthorizationV1Api()
-            rb = V1RoleBinding(
-                metadata=client.V1ObjectMeta(name=f"{sa_name}-binding"),
-                subjects=[
-                    client.V1Subject(
-                        kind="ServiceAccount",
-                        name=sa_name,
-                        namespace=namespace
-                    )
-                ],
-                role_ref=client.V1RoleRef(
-                    kind="Role",
-                    name=role_name,
-                    api_group="rbac.authorization.k8s.io"
-                )
+            self._rbac_v1.create_namespaced_role_binding(
+                namespace,
+                self._role_binding_obj(namespace, sa_name, role_name)
             )
-            rbac.create_namespaced_role_binding(namespace, rb)
             logger.info(f"Role binding created for {sa_name}")
             
         except Exception as e:
@@ -110,8 +235,7 @@ class KubernetesClusterSetup:
             deployment: Deployment object
         """
         try:
-            apps = client.AppsV1Api()
-            apps.create_namespaced_deployment(
+            self._apps_v1.create_namespaced_deployment(
                 body=deployment,
                 namespace=deployment.metadata.namespace
             )
@@ -128,8 +252,7 @@ class KubernetesClusterSetup:
             service: Service object
         """
         try:
-            v1 = client.CoreV1Api()
-            v1.create_namespaced_service(
+            self.k8s_client.create_namespaced_service(
                 body=service,
                 namespace=service.metadata.namespace
             )
@@ -146,8 +269,7 @@ class KubernetesClusterSetup:
             ingress: Ingress object
         """
         try:
-            networking = client.NetworkingV1Api()
-            networking.create_namespaced_ingress(
+            self._networking_v1.create_namespaced_ingress(
                 body=ingress,
                 namespace=ingress.metadata.namespace
             )
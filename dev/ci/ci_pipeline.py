@@ -1,16 +1,38 @@
 import logging
 import asyncio
-import aiohttp
-from typing import Dict, List, Optional
+import functools
+from typing import Dict, List, Optional, TYPE_CHECKING
 import yaml
 import json
 from datetime import datetime
 import subprocess
 import os
 import tempfile
-import docker
-import kubernetes
-from kubernetes import client, config
+import time
+import atexit
+import shutil
+import itertools
+import copy
+from collections import deque
+
+# aiohttp, docker, kubernetes and opentracing are imported on first use so
+# that pipelines which never touch them don't pay their import/connect cost
+if TYPE_CHECKING:
+    import aiohttp
+    import docker
+    import kubernetes
+    import opentracing
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# libyaml's C loader parses several times faster than the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 logging.basicConfig(
     level=logging.INFO,
@@ -18,12 +40,113 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+async def _to_thread(func, *args, **kwargs):
+    """Run a blocking SDK call in the default executor.
+
+    Equivalent to asyncio.to_thread, which is unavailable on Python 3.8.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+@functools.lru_cache(maxsize=1)
+def _get_api_client() -> "kubernetes.client.ApiClient":
+    """Load cluster credentials once per process and share the client.
+
+    Tries the in-cluster service account first, then ~/.kube/config.
+    """
+    from kubernetes import client, config
+    try:
+        config.load_incluster_config()
+    except config.ConfigException:
+        config.load_kube_config()
+    return client.ApiClient()
+
+# Lines of docker build/push output kept in task results; the full log
+# goes to a file under logs/
+LOG_TAIL_LINES = 200
+
+def _stream_docker_log(chunks, log_path: str) -> str:
+    """Write docker-py progress chunks to a file as they arrive.
+
+    Only the ``stream``/``status``/``error`` text of each chunk is kept,
+    and only the last LOG_TAIL_LINES lines are held in memory.
+
+    Returns:
+        The log file path followed by the tail of the log
+    """
+    os.makedirs(os.path.dirname(log_path), exist_ok=True)
+    tail = deque(maxlen=LOG_TAIL_LINES)
+    with open(log_path, 'w') as f:
+        for chunk in chunks:
+            if isinstance(chunk, dict):
+                line = chunk.get('stream') or chunk.get('status') or chunk.get('error')
+            elif isinstance(chunk, bytes):
+                line = chunk.decode('utf-8', 'replace')
+            else:
+                line = str(chunk)
+            if not line:
+                continue
+            line = line.rstrip('\n')
+            f.write(line + '\n')
+            tail.append(line)
+    return f"Full log: {log_path}\n" + '\n'.join(tail)
+
+# Bytes of container output kept in task results; the full log stays on disk
+LOG_TAIL_BYTES = 64 * 1024
+
+def _stream_container_log(container, log_path: str) -> str:
+    """Follow a container's output straight into a file.
+
+    The log is transferred from the daemon once, as it is produced, and
+    only the last LOG_TAIL_BYTES are read back into memory.
+
+    Returns:
+        The tail of the container output
+    """
+    with open(log_path, 'w+b') as f:
+        for chunk in container.logs(stream=True, follow=True):
+            f.write(chunk)
+        size = f.tell()
+        f.seek(max(0, size - LOG_TAIL_BYTES))
+        return f.read().decode('utf-8', 'replace')
+
+# Static parts of a Slack alert; _send_slack_alert fills in the rest
+_SLACK_TEMPLATE = {
+    "text": None,
+    "attachments": [
+        {
+            "color": None,
+            "title": None,
+            "fields": [
+                {"title": "Severity", "value": None, "short": True},
+                {"title": "Value", "value": None, "short": True},
+                {"title": "Threshold", "value": None, "short": True}
+            ]
+        }
+    ]
+}
+
 class CIPipeline:
     def __init__(self, config_file: str = "ci_config.yaml"):
         self.config = self._load_config(config_file)
-        self.session = aiohttp.ClientSession()
-        self.docker_client = docker.from_env()
-        self.k8s_client = self._init_k8s_client()
+        self._session = None
+        self._docker_client = None
+        self._k8s_client = None
+        # One scratch directory for all container task logs, removed at exit
+        self._logs_root = tempfile.mkdtemp(prefix='ci-logs-')
+        self._task_seq = itertools.count()
+        atexit.register(shutil.rmtree, self._logs_root, ignore_errors=True)
+        # Partition notification channels once instead of per alert
+        channels = self.config.get('notifications', {}).get('channels', [])
+        self._slack_channels = [c for c in channels if c['type'] == 'slack' and c.get('webhook')]
+        self._email_channels = [c for c in channels if c['type'] == 'email' and c.get('recipients')]
+        self._pagerduty_channels = [c for c in channels if c['type'] == 'pagerduty' and c.get('service_key')]
         self.results = {
             'pipeline': {},
             'metrics': {},
@@ -32,14 +155,67 @@ class CIPipeline:
         }
 
     def _load_config(self, config_file: str) -> Dict:
-        """Load CI configuration."""
+        """Load CI configuration.
+
+        If ``<config_file>.json`` exists and is at least as new as the YAML
+        file, it is loaded instead; JSON parses far faster than YAML. The
+        sidecar can be generated with e.g.
+        ``python -c "import json,yaml; print(json.dumps(yaml.safe_load(open('ci_config.yaml'))))" > ci_config.yaml.json``.
+        """
+        json_file = f"{config_file}.json"
+        try:
+            if os.stat(json_file).st_mtime >= os.stat(config_file).st_mtime:
+                with open(json_file, 'rb') as f:
+                    return json.loads(f.read())
+        except FileNotFoundError:
+            pass
+            
         with open(config_file) as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_YamlLoader)
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """HTTP session, created on first use.
+
+        One pooled connector is shared by every webhook call so repeated
+        posts to the same host reuse the TCP/TLS connection.
+        """
+        if self._session is None:
+            import aiohttp
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                ),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the HTTP session if one was opened."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @property
+    def docker_client(self) -> "docker.DockerClient":
+        """Docker client, created on first use."""
+        if self._docker_client is None:
+            import docker
+            self._docker_client = docker.from_env()
+        return self._docker_client
 
-    def _init_k8s_client(self) -> kubernetes.client.ApiClient:
+    @property
+    def k8s_client(self) -> "kubernetes.client.ApiClient":
+        """Kubernetes API client, created on first use."""
+        if self._k8s_client is None:
+            self._k8s_client = self._init_k8s_client()
+        return self._k8s_client
+
+    def _init_k8s_client(self) -> "kubernetes.client.ApiClient":
         """Initialize Kubernetes client."""
-        config.load_kube_config()
-        return client.ApiClient()
+        return _get_api_client()
 
     async def run_pipeline(self) -> Dict:
         """Run the CI/CD pipeline."""
@@ -47,9 +223,9 @@ class CIPipeline:
         span = self._start_trace("pipeline")
         
         try:
-            # Run pipeline stages
-            for stage in self.config['pipeline']['stages']:
-                await self._run_stage(stage)
+            # Run pipeline stages, independent stages of a wave concurrently
+            for wave in self._stage_waves(self.config['pipeline']['stages']):
+                await asyncio.gather(*(self._run_stage(stage) for stage in wave))
             
             # Calculate pipeline metrics
             self._calculate_metrics()
@@ -73,6 +249,39 @@ class CIPipeline:
             
         finally:
             span.finish()
+            await self.aclose()
+
+    def _stage_waves(self, stages: List[Dict]) -> List[List[Dict]]:
+        """Group stages into waves that can run concurrently.
+
+        A stage may list the stages it needs in ``depends_on``. Stages
+        without it depend on the previous stage, unless the pipeline sets
+        ``parallel_stages: true``, in which case they depend on nothing.
+        """
+        parallel = self.config['pipeline'].get('parallel_stages', False)
+        deps = {}
+        previous = None
+        for stage in stages:
+            if 'depends_on' in stage:
+                deps[stage['name']] = set(stage['depends_on'])
+            elif parallel or previous is None:
+                deps[stage['name']] = set()
+            else:
+                deps[stage['name']] = {previous}
+            previous = stage['name']
+
+        waves = []
+        done = set()
+        remaining = list(stages)
+        while remaining:
+            wave = [stage for stage in remaining if deps[stage['name']] <= done]
+            if not wave:
+                blocked = ', '.join(stage['name'] for stage in remaining)
+                raise ValueError(f"Unresolvable stage dependencies: {blocked}")
+            waves.append(wave)
+            done.update(stage['name'] for stage in wave)
+            remaining = [stage for stage in remaining if stage['name'] not in done]
+        return waves
 
     async def _run_stage(self, stage: Dict) -> None:
         """Run a pipeline stage."""
@@ -83,7 +292,9 @@ class CIPipeline:
             'status': 'running',
             'start_time': datetime.now().isoformat(),
             'end_time': None,
-            'duration': None
+            'duration': None,
+            '_start_mono': time.monotonic(),
+            '_end_mono': None
         }
         
         # Run tasks in parallel
@@ -101,12 +312,11 @@ class CIPipeline:
         else:
             stage_result['status'] = 'success'
         
-        # Update stage duration
+        # Update stage duration from the monotonic clock rather than
+        # re-parsing the ISO timestamps
         stage_result['end_time'] = datetime.now().isoformat()
-        stage_result['duration'] = (
-            datetime.fromisoformat(stage_result['end_time']) -
-            datetime.fromisoformat(stage_result['start_time'])
-        ).total_seconds()
+        stage_result['_end_mono'] = time.monotonic()
+        stage_result['duration'] = stage_result['_end_mono'] - stage_result['_start_mono']
         
         # Add to pipeline results
         self.results['pipeline'][stage['name']] = stage_result
@@ -124,22 +334,19 @@ class CIPipeline:
             'output': None,
             'error': None
         }
+        start_mono = time.monotonic()
         
         # Start task trace
         span = self._start_trace(f"task_{task['name']}")
         
         try:
-            # Run task based on type
-            if task['name'] == 'docker_build':
-                await self._run_docker_build(task, task_result)
-            elif task['name'] == 'docker_push':
-                await self._run_docker_push(task, task_result)
-            elif task['name'] == 'k8s_deploy':
-                await self._run_k8s_deploy(task, task_result)
-            elif task['name'] == 'k8s_verify':
-                await self._run_k8s_verify(task, task_result)
-            else:
-                await self._run_container_task(task, task_result)
+            # Run task based on its ``type`` (falling back to its name);
+            # anything unregistered runs in a container
+            handler = self._HANDLERS.get(
+                task.get('type', task['name']),
+                CIPipeline._run_container_task
+            )
+            await handler(self, task, task_result)
             
             task_result['status'] = 'success'
             
@@ -150,10 +357,7 @@ class CIPipeline:
         finally:
             # Update task duration
             task_result['end_time'] = datetime.now().isoformat()
-            task_result['duration'] = (
-                datetime.fromisoformat(task_result['end_time']) -
-                datetime.fromisoformat(task_result['start_time'])
-            ).total_seconds()
+            task_result['duration'] = time.monotonic() - start_mono
             
             span.finish()
             
@@ -161,125 +365,181 @@ class CIPipeline:
 
     async def _run_container_task(self, task: Dict, result: Dict) -> None:
         """Run a container-based task."""
-        # Create temporary directory for logs
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Run container
-            container = self.docker_client.containers.run(
-                task['image'],
-                command=task['command'],
-                args=task['args'],
-                volumes={
-                    os.getcwd(): {'bind': '/workspace', 'mode': 'rw'},
-                    temp_dir: {'bind': '/logs', 'mode': 'rw'}
-                },
-                working_dir='/workspace',
-                detach=True
-            )
-            
-            # Wait for container to finish
-            container.wait()
-            
-            # Get logs
-            result['output'] = container.logs().decode('utf-8')
-            
-            # Clean up
-            container.remove()
+        # Per-task log directory under the pipeline's scratch root
+        log_dir = os.path.join(self._logs_root, f"{next(self._task_seq)}_{task['name']}")
+        os.mkdir(log_dir)
+        
+        # Run container; docker-py blocks, so keep it off the event loop
+        container = await _to_thread(
+            self.docker_client.containers.run,
+            task['image'],
+            command=task['command'],
+            args=task['args'],
+            volumes={
+                os.getcwd(): {'bind': '/workspace', 'mode': 'rw'},
+                log_dir: {'bind': '/logs', 'mode': 'rw'}
+            },
+            working_dir='/workspace',
+            detach=True
+        )
+        
+        # Stream logs to disk while waiting for the container to exit
+        _, result['output'] = await asyncio.gather(
+            _to_thread(container.wait),
+            _to_thread(_stream_container_log, container, os.path.join(log_dir, 'output.log'))
+        )
+        
+        # Clean up
+        await _to_thread(container.remove)
 
     async def _run_docker_build(self, task: Dict, result: Dict) -> None:
         """Run Docker build task."""
         image_tag = f"orchestratex:{os.environ.get('GITHUB_REF_NAME', 'latest')}"
         
-        # Build image
-        build_logs = self.docker_client.images.build(
-            path=os.getcwd(),
-            tag=image_tag,
-            rm=True,
-            pull=True
-        )
+        images = self.docker_client.images
+        
+        def build() -> str:
+            # Build image
+            _, build_logs = images.build(
+                path=os.getcwd(),
+                tag=image_tag,
+                rm=True,
+                pull=True
+            )
+            
+            # Get logs
+            return _stream_docker_log(build_logs, os.path.join('logs', 'docker_build.log'))
         
-        # Get logs
-        result['output'] = '\n'.join(str(log) for log in build_logs)
+        result['output'] = await _to_thread(build)
 
     async def _run_docker_push(self, task: Dict, result: Dict) -> None:
         """Run Docker push task."""
         image_tag = f"orchestratex:{os.environ.get('GITHUB_REF_NAME', 'latest')}"
         
-        # Push image
-        push_logs = self.docker_client.images.push(
-            repository="orchestratex",
-            tag=os.environ.get('GITHUB_REF_NAME', 'latest'),
-            stream=True
-        )
+        images = self.docker_client.images
+        
+        def push() -> str:
+            # Push image
+            push_logs = images.push(
+                repository="orchestratex",
+                tag=os.environ.get('GITHUB_REF_NAME', 'latest'),
+                stream=True,
+                decode=True
+            )
+            
+            # Get logs; the stream is consumed here, off the event loop
+            return _stream_docker_log(push_logs, os.path.join('logs', 'docker_push.log'))
         
-        # Get logs
-        result['output'] = '\n'.join(str(log) for log in push_logs)
+        result['output'] = await _to_thread(push)
 
     async def _run_k8s_deploy(self, task: Dict, result: Dict) -> None:
         """Run Kubernetes deployment task."""
         # Load deployment YAML
         with open(task['args'][1]) as f:
-            deployment = yaml.safe_load(f)
+            deployment = yaml.load(f, Loader=_YamlLoader)
             
         # Create deployment
+        from kubernetes import client
         v1 = client.AppsV1Api(self.k8s_client)
-        v1.create_namespaced_deployment(
+        await _to_thread(
+            v1.create_namespaced_deployment,
             body=deployment,
             namespace=task['args'][3]
         )
         
         # Get deployment status
-        result['output'] = json.dumps(
-            v1.read_namespaced_deployment_status(
-                name=deployment['metadata']['name'],
-                namespace=task['args'][3]
-            ).to_dict(),
-            indent=2
+        status = await _to_thread(
+            v1.read_namespaced_deployment_status,
+            name=deployment['metadata']['name'],
+            namespace=task['args'][3]
         )
+        # sanitize_for_serialization yields the wire-format dict directly,
+        # skipping to_dict()'s snake_case model walk
+        result['output'] = _dumps(self.k8s_client.sanitize_for_serialization(status)).decode('utf-8')
 
     async def _run_k8s_verify(self, task: Dict, result: Dict) -> None:
-        """Run Kubernetes verification task."""
-        # Wait for pods
+        """Run Kubernetes verification task.
+
+        Lists the pods once, then follows a watch from that list's
+        resourceVersion until every pod is Running, instead of polling.
+        Fails if that doesn't happen within ``timeout`` seconds (default 120).
+        """
+        from kubernetes import client, watch
         v1 = client.CoreV1Api(self.k8s_client)
-        pods = v1.list_namespaced_pod(
-            namespace=task['args'][5],
-            label_selector=task['args'][3]
-        )
+        namespace = task['args'][5]
+        label_selector = task['args'][3]
+        timeout = task.get('timeout', 120)
+        
+        def wait_for_pods() -> List:
+            pods = v1.list_namespaced_pod(namespace=namespace, label_selector=label_selector)
+            by_name = {p.metadata.name: p for p in pods.items}
+            pending = {name for name, p in by_name.items() if p.status.phase != 'Running'}
+            if not pending:
+                return list(by_name.values())
+            
+            # Wait for pods; the server pushes changes over one connection
+            w = watch.Watch()
+            for event in w.stream(
+                v1.list_namespaced_pod,
+                namespace=namespace,
+                label_selector=label_selector,
+                resource_version=pods.metadata.resource_version,
+                timeout_seconds=timeout
+            ):
+                pod = event['object']
+                name = pod.metadata.name
+                if event['type'] == 'DELETED':
+                    by_name.pop(name, None)
+                    pending.discard(name)
+                else:
+                    by_name[name] = pod
+                    if pod.status.phase == 'Running':
+                        pending.discard(name)
+                    else:
+                        pending.add(name)
+                if not pending:
+                    w.stop()
+                    break
+                    
+            # Verify pod status
+            if pending:
+                raise Exception(f"Pods not running after {timeout}s: {', '.join(sorted(pending))}")
+            return list(by_name.values())
         
-        # Verify pod status
-        for pod in pods.items:
-            if pod.status.phase != 'Running':
-                raise Exception(f"Pod {pod.metadata.name} not running")
+        pods = await _to_thread(wait_for_pods)
         
         # Get pod status
-        result['output'] = json.dumps(
-            [p.to_dict() for p in pods.items],
-            indent=2
-        )
+        result['output'] = _dumps(self.k8s_client.sanitize_for_serialization(pods)).decode('utf-8')
+
+    # Task type -> handler; subclasses may extend this to register new types
+    _HANDLERS = {
+        'docker_build': _run_docker_build,
+        'docker_push': _run_docker_push,
+        'k8s_deploy': _run_k8s_deploy,
+        'k8s_verify': _run_k8s_verify
+    }
 
     def _calculate_metrics(self) -> None:
         """Calculate pipeline metrics."""
-        # Calculate success rate
-        total_tasks = sum(len(stage['tasks']) for stage in self.results['pipeline'].values())
-        successful_tasks = sum(
-            1 for stage in self.results['pipeline'].values()
-            for task in stage['tasks']
-            if task['status'] == 'success'
-        )
+        # Success rate and duration in a single pass over the stages
+        total_tasks = 0
+        successful_tasks = 0
+        start_time = float('inf')
+        end_time = float('-inf')
+        for stage in self.results['pipeline'].values():
+            for task in stage['tasks']:
+                total_tasks += 1
+                if task['status'] == 'success':
+                    successful_tasks += 1
+            if stage['_start_mono'] < start_time:
+                start_time = stage['_start_mono']
+            if stage['_end_mono'] > end_time:
+                end_time = stage['_end_mono']
+                
         success_rate = (successful_tasks / total_tasks) * 100 if total_tasks > 0 else 0.0
+        duration = end_time - start_time if self.results['pipeline'] else 0.0
         
         self.results['metrics']['pipeline_success_rate'] = success_rate
-        
-        # Calculate duration
-        start_time = min(
-            datetime.fromisoformat(stage['start_time'])
-            for stage in self.results['pipeline'].values()
-        )
-        end_time = max(
-            datetime.fromisoformat(stage['end_time'])
-            for stage in self.results['pipeline'].values()
-        )
-        duration = (end_time - start_time).total_seconds()
-        
         self.results['metrics']['pipeline_duration'] = duration
 
     def _generate_report(self) -> None:
@@ -301,45 +561,49 @@ class CIPipeline:
         }
         
         # Save report
-        with open('pipeline_report.json', 'w') as f:
-            json.dump(report, f, indent=2)
+        with open('pipeline_report.json', 'wb') as f:
+            f.write(_dumps(report))
 
     def _check_alerts(self) -> None:
         """Check for alerts based on pipeline results."""
+        rules = self.config['alerts']['rules']
+        metrics = self.results['metrics']
+        
         # Check success rate
-        success_rate = self.results['metrics']['pipeline_success_rate']
-        if success_rate < self.config['alerts']['rules']['pipeline_failure']['threshold']:
+        success_rate = metrics['pipeline_success_rate']
+        threshold = rules['pipeline_failure']['threshold']
+        if success_rate < threshold:
             self.results['alerts'].append({
                 'severity': 'critical',
                 'description': 'Pipeline failure rate too high',
                 'value': success_rate,
-                'threshold': self.config['alerts']['rules']['pipeline_failure']['threshold']
+                'threshold': threshold
             })
         
         # Check duration
-        duration = self.results['metrics']['pipeline_duration']
-        if duration > self.config['alerts']['rules']['pipeline_duration']['threshold']:
+        duration = metrics['pipeline_duration']
+        threshold = rules['pipeline_duration']['threshold']
+        if duration > threshold:
             self.results['alerts'].append({
                 'severity': 'warning',
                 'description': 'Pipeline duration too long',
                 'value': duration,
-                'threshold': self.config['alerts']['rules']['pipeline_duration']['threshold']
+                'threshold': threshold
             })
 
     async def _send_notifications(self) -> None:
         """Send pipeline notifications."""
-        for alert in self.results['alerts']:
-            await self._send_alert(alert)
+        # Alerts are independent, so post them concurrently over the
+        # shared session
+        await asyncio.gather(*(self._send_alert(alert) for alert in self.results['alerts']))
 
     async def _send_alert(self, alert: Dict) -> None:
         """Send an alert notification."""
-        for channel in self.config['notifications']['channels']:
-            if channel['type'] == 'slack':
-                await self._send_slack_alert(alert, channel)
-            elif channel['type'] == 'email':
-                await self._send_email_alert(alert, channel)
-            elif channel['type'] == 'pagerduty':
-                await self._send_pagerduty_alert(alert, channel)
+        await asyncio.gather(
+            *(self._send_slack_alert(alert, c) for c in self._slack_channels),
+            *(self._send_email_alert(alert, c) for c in self._email_channels),
+            *(self._send_pagerduty_alert(alert, c) for c in self._pagerduty_channels)
+        )
 
     async def _send_slack_alert(self, alert: Dict, channel: Dict) -> None:
         """Send Slack alert notification."""
@@ -347,32 +611,15 @@ class CIPipeline:
         if not webhook:
             return
 
-        payload = {
-            "text": f"Pipeline Alert: {alert['severity']} - {alert['description']}",
-            "attachments": [
-                {
-                    "color": "danger" if alert['severity'] == 'critical' else "warning",
-                    "title": alert['description'],
-                    "fields": [
-                        {
-                            "title": "Severity",
-                            "value": alert['severity'],
-                            "short": True
-                        },
-                        {
-                            "title": "Value",
-                            "value": str(alert['value']),
-                            "short": True
-                        },
-                        {
-                            "title": "Threshold",
-                            "value": str(alert['threshold']),
-                            "short": True
-                        }
-                    ]
-                }
-            ]
-        }
+        payload = copy.deepcopy(_SLACK_TEMPLATE)
+        payload["text"] = f"Pipeline Alert: {alert['severity']} - {alert['description']}"
+        attachment = payload["attachments"][0]
+        attachment["color"] = "danger" if alert['severity'] == 'critical' else "warning"
+        attachment["title"] = alert['description']
+        fields = attachment["fields"]
+        fields[0]["value"] = alert['severity']
+        fields[1]["value"] = str(alert['value'])
+        fields[2]["value"] = str(alert['threshold'])
 
         async with self.session.post(webhook, json=payload) as response:
             if response.status != 200:
@@ -396,8 +643,9 @@ class CIPipeline:
         # Implementation of PagerDuty sending
         pass
 
-    def _start_trace(self, operation_name: str) -> opentracing.Span:
+    def _start_trace(self, operation_name: str) -> "opentracing.Span":
         """Start a new trace."""
+        import opentracing
         tracer = opentracing.global_tracer()
         return tracer.start_span(operation_name)
 
@@ -407,4 +655,12 @@ if __name__ == "__main__":
         results = await pipeline.run_pipeline()
         print(json.dumps(results, indent=2))
 
+    # uvloop speeds up subprocess and socket-heavy loops; POSIX only
+    if os.name == "posix":
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+
     asyncio.run(main())
@@ -2,11 +2,18 @@ import os
 import sys
 import inspect
 import json
+import hashlib
+import importlib
+import importlib.util
 import yaml
 from pathlib import Path
 import shutil
+import copy
 import subprocess
 import logging
+import functools
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
 
 logging.basicConfig(
     level=logging.INFO,
@@ -14,12 +21,59 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# libyaml's C loader and emitter when available
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml(path: str, mtime_ns: int) -> dict:
+    """Parse a YAML file once per (path, mtime) within this process."""
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+# First-line comment carrying each generated file's input fingerprint
+_FP_COMMENTS = {
+    ".md": "<!-- fp: {} -->",
+    ".mmd": "%% fp: {}",
+    ".yaml": "# fp: {}"
+}
+
+def _class_functions(cls: type) -> list:
+    """List a class's plain and static methods, including inherited ones.
+
+    Equivalent to ``inspect.getmembers(cls, inspect.isfunction)`` but reads
+    each class __dict__ along the MRO instead of calling getattr per name.
+    """
+    functions = {}
+    for klass in cls.__mro__:
+        for name, attr in vars(klass).items():
+            if name in functions:
+                continue
+            if isinstance(attr, staticmethod):
+                attr = attr.__func__
+            functions[name] = attr
+    return sorted(
+        (name, attr) for name, attr in functions.items()
+        if inspect.isfunction(attr)
+    )
+
 class DocumentationGenerator:
+    # Bump when generator output changes so existing docs are regenerated
+    FORMAT_VERSION = 3
+
     def __init__(self, project_root: str = os.getcwd()):
         self.project_root = Path(project_root)
         self.docs_dir = self.project_root / "docs"
         self.api_dir = self.docs_dir / "api"
+        self._arch_dir = self.docs_dir / "architecture"
+        self._diagrams_dir = self._arch_dir / "diagrams"
+        self._deploy_dir = self.docs_dir / "deployment"
         self.config = self._load_config()
+        self._cache_path = self.docs_dir / ".doc_cache.json"
+        self._doc_cache = self._load_doc_cache()
+        self._doc_cache_dirty = False
 
     def _load_config(self) -> dict:
         """Load documentation configuration."""
@@ -27,15 +81,72 @@ class DocumentationGenerator:
         if not config_path.exists():
             raise FileNotFoundError(f"Config file not found: {config_path}")
             
-        with open(config_path) as f:
-            return yaml.safe_load(f)
+        # Copy so generators can't mutate the cached parse
+        return copy.deepcopy(_load_yaml(str(config_path), config_path.stat().st_mtime_ns))
+
+    def _load_doc_cache(self) -> dict:
+        """Load the path -> fingerprint map of previously generated docs."""
+        try:
+            with open(self._cache_path) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save_doc_cache(self) -> None:
+        """Persist the path -> fingerprint map if anything was regenerated."""
+        if not self._doc_cache_dirty:
+            return
+        self._doc_cache_dirty = False
+        self._cache_path.write_text(json.dumps(self._doc_cache, indent=2, sort_keys=True))
+
+    def _fingerprint(self, *sections) -> str:
+        """Hash the config sections a generator reads."""
+        payload = json.dumps([self.FORMAT_VERSION, sections], sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+    def _module_stamps(self) -> list:
+        """Locate documented modules without importing them.
+        
+        The API reference depends on module source as well as config, so
+        each module's file and mtime go into its fingerprint.
+        """
+        stamps = []
+        for module_name in self.config.get('modules', []):
+            try:
+                spec = importlib.util.find_spec(module_name)
+                origin = spec.origin if spec else None
+                mtime = os.stat(origin).st_mtime_ns if origin and os.path.exists(origin) else None
+            except (ImportError, ValueError):
+                origin = mtime = None
+            stamps.append([module_name, origin, mtime])
+        return stamps
+
+    def _is_current(self, path: Path, fp: str) -> bool:
+        """Check whether path was generated from inputs with fingerprint fp."""
+        cached = self._doc_cache.get(str(path.relative_to(self.docs_dir)))
+        if cached is not None:
+            return cached == fp and path.exists()
+            
+        # No cache entry; fall back to the fingerprint line in the file
+        try:
+            with open(path) as f:
+                first_line = f.readline().rstrip("\n")
+        except FileNotFoundError:
+            return False
+        return first_line == _FP_COMMENTS[path.suffix].format(fp)
+
+    def _write_doc(self, path: Path, fp: str, content: str) -> None:
+        """Write a generated doc headed by its fingerprint line."""
+        path.write_text(_FP_COMMENTS[path.suffix].format(fp) + "\n" + content)
+        self._doc_cache[str(path.relative_to(self.docs_dir))] = fp
+        self._doc_cache_dirty = True
 
     def generate_api_docs(self) -> None:
         """Generate API documentation."""
         logger.info("Generating API documentation...")
         
         # Create API directory
-        os.makedirs(self.api_dir, exist_ok=True)
+        self.api_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate API reference
         self._generate_api_reference()
@@ -43,93 +154,124 @@ class DocumentationGenerator:
         self._generate_api_examples()
         self._generate_api_changelog()
         
+        self._save_doc_cache()
         logger.info("API documentation generation complete")
 
     def _generate_api_reference(self) -> None:
         """Generate API reference documentation."""
         api_ref_path = self.api_dir / "reference.md"
+        fp = self._fingerprint(self._module_stamps())
+        if self._is_current(api_ref_path, fp):
+            return
         
-        with open(api_ref_path, 'w') as f:
-            f.write("# API Reference\n\n")
-            
-            # Get all modules
-            for module_name in self.config.get('modules', []):
-                try:
-                    module = __import__(module_name)
-                    f.write(f"## {module_name}\n\n")
+        # Sections are collected and written in one call
+        parts = ["# API Reference\n\n"]
+        
+        # Inherited methods recur across subclasses; resolve each doc once
+        docs = {}
+        getdoc = inspect.getdoc
+        
+        # Get all modules
+        for module_name in self.config.get('modules', []):
+            try:
+                # Skip missing modules without importing anything, and reuse
+                # modules that are already loaded
+                if importlib.util.find_spec(module_name) is None:
+                    logger.warning(f"Could not find module {module_name}")
+                    continue
+                module = sys.modules.get(module_name) or importlib.import_module(module_name)
+                parts.append(f"## {module_name}\n\n")
+                
+                # Get all classes; reading vars() avoids getattr on every
+                # attribute, which would trigger lazy module attributes
+                classes = sorted(
+                    (name, obj) for name, obj in vars(module).items()
+                    if isinstance(obj, type)
+                )
+                for name, obj in classes:
+                    parts.append(f"### {name}\n\n")
+                    doc = getdoc(obj)
+                    if doc:
+                        parts.append(f"{doc}\n\n")
                     
-                    # Get all classes
-                    for name, obj in inspect.getmembers(module):
-                        if inspect.isclass(obj):
-                            f.write(f"### {name}\n\n")
-                            doc = inspect.getdoc(obj)
-                            if doc:
-                                f.write(f"{doc}\n\n")
-                            
-                            # Get methods
-                            for method_name in dir(obj):
-                                method = getattr(obj, method_name)
-                                if inspect.isfunction(method):
-                                    f.write(f"#### {method_name}\n\n")
-                                    doc = inspect.getdoc(method)
-                                    if doc:
-                                        f.write(f"{doc}\n\n")
-                except ImportError as e:
-                    logger.warning(f"Could not import module {module_name}: {str(e)}")
+                    # Get methods
+                    for method_name, method in _class_functions(obj):
+                        parts.append(f"#### {method_name}\n\n")
+                        key = id(method)
+                        if key not in docs:
+                            docs[key] = getdoc(method)
+                        doc = docs[key]
+                        if doc:
+                            parts.append(f"{doc}\n\n")
+            except ImportError as e:
+                logger.warning(f"Could not import module {module_name}: {str(e)}")
+                
+        self._write_doc(api_ref_path, fp, "".join(parts))
 
     def _generate_swagger_docs(self) -> None:
         """Generate Swagger/OpenAPI documentation."""
         swagger_path = self.api_dir / "api.yaml"
+        fp = self._fingerprint(self.config.get('endpoints'))
+        if self._is_current(swagger_path, fp):
+            return
+        
+        spec = {
+            "openapi": "3.0.0",
+            "info": {
+                "title": "Orchestratex API",
+                "version": "1.0.0"
+            },
+            "paths": {}
+        }
         
-        with open(swagger_path, 'w') as f:
-            f.write("openapi: 3.0.0\n")
-            f.write("info:\n")
-            f.write("  title: Orchestratex API\n")
-            f.write("  version: 1.0.0\n")
-            f.write("paths:\n")
+        # Add endpoints; several methods may share a path
+        for endpoint in self.config.get('endpoints', []):
+            spec["paths"].setdefault(endpoint['path'], {})[endpoint['method']] = {
+                "summary": endpoint.get('summary', ''),
+                "description": endpoint.get('description', ''),
+                "responses": {
+                    "200": {"description": "Success"}
+                }
+            }
             
-            # Add endpoints
-            for endpoint in self.config.get('endpoints', []):
-                f.write(f"  {endpoint['path']}:\n")
-                f.write(f"    {endpoint['method']}:\n")
-                f.write("      summary: " + endpoint.get('summary', '') + "\n")
-                f.write("      description: " + endpoint.get('description', '') + "\n")
-                f.write("      responses:\n")
-                f.write("        '200':\n")
-                f.write("          description: Success\n")
+        self._write_doc(swagger_path, fp, yaml.dump(spec, Dumper=_YamlDumper, sort_keys=False))
 
     def _generate_api_examples(self) -> None:
         """Generate API usage examples."""
         examples_path = self.api_dir / "examples.md"
+        fp = self._fingerprint(self.config.get('examples'))
+        if self._is_current(examples_path, fp):
+            return
+        
+        parts = ["# API Examples\n\n"]
         
-        with open(examples_path, 'w') as f:
-            f.write("# API Examples\n\n")
+        # Add examples
+        for example in self.config.get('examples', []):
+            parts.append(f"## {example['title']}\n\n```python\n{example['code']}\n```\n\n")
             
-            # Add examples
-            for example in self.config.get('examples', []):
-                f.write(f"## {example['title']}\n\n")
-                f.write(f"```python\n")
-                f.write(f"{example['code']}\n")
-                f.write("```\n\n")
+        self._write_doc(examples_path, fp, "".join(parts))
 
     def _generate_api_changelog(self) -> None:
         """Generate API changelog."""
         changelog_path = self.api_dir / "changelog.md"
+        fp = self._fingerprint(self.config.get('changelog'))
+        if self._is_current(changelog_path, fp):
+            return
         
-        with open(changelog_path, 'w') as f:
-            f.write("# API Changelog\n\n")
+        parts = ["# API Changelog\n\n"]
+        
+        # Add changelog entries
+        for entry in self.config.get('changelog', []):
+            parts.append(f"## {entry['version']}\n\n{entry['description']}\n\n")
             
-            # Add changelog entries
-            for entry in self.config.get('changelog', []):
-                f.write(f"## {entry['version']}\n\n")
-                f.write(f"{entry['description']}\n\n")
+        self._write_doc(changelog_path, fp, "".join(parts))
 
     def generate_architecture_docs(self) -> None:
         """Generate architecture documentation."""
         logger.info("Generating architecture documentation...")
         
-        arch_dir = self.docs_dir / "architecture"
-        os.makedirs(arch_dir, exist_ok=True)
+        # One mkdir covers the architecture dir and its diagrams subdir
+        self._diagrams_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate architecture overview
         self._generate_architecture_overview()
@@ -137,89 +279,102 @@ class DocumentationGenerator:
         self._generate_sequence_diagrams()
         self._generate_system_context_diagram()
         
+        self._save_doc_cache()
         logger.info("Architecture documentation generation complete")
 
     def _generate_architecture_overview(self) -> None:
         """Generate architecture overview documentation."""
-        overview_path = self.docs_dir / "architecture" / "overview.md"
+        overview_path = self._arch_dir / "overview.md"
+        fp = self._fingerprint(self.config.get('components'))
+        if self._is_current(overview_path, fp):
+            return
+        
+        parts = ["# System Architecture\n\n## Components\n\n"]
         
-        with open(overview_path, 'w') as f:
-            f.write("# System Architecture\n\n")
-            f.write("## Components\n\n")
+        # Add components
+        for component in self.config.get('components', []):
+            parts.append(f"### {component['name']}\n\n{component['description']}\n\n")
             
-            # Add components
-            for component in self.config.get('components', []):
-                f.write(f"### {component['name']}\n\n")
-                f.write(f"{component['description']}\n\n")
-                
-                # Add responsibilities
-                f.write("#### Responsibilities\n")
-                for resp in component.get('responsibilities', []):
-                    f.write(f"- {resp}\n")
+            # Add responsibilities
+            parts.append("#### Responsibilities\n")
+            parts.extend(f"- {resp}\n" for resp in component.get('responsibilities', []))
+            
+        self._write_doc(overview_path, fp, "".join(parts))
+
+    def _render_graph(self, header: str, nodes, edges) -> str:
+        """Render a Mermaid flowchart: header, node lines, then edge lines.
+        
+        Args:
+            header: Diagram declaration, e.g. "graph TD"
+            nodes: Dicts with 'id' and 'name'
+            edges: (source id, target id) pairs
+        """
+        lines = [header]
+        lines.extend(f"    {node['id']}[{node['name']}]" for node in nodes)
+        lines.extend(f"    {source} --> {target}" for source, target in edges)
+        return "\n".join(lines) + "\n"
 
     def _generate_component_diagrams(self) -> None:
         """Generate component diagrams."""
-        diagrams_dir = self.docs_dir / "architecture" / "diagrams"
-        os.makedirs(diagrams_dir, exist_ok=True)
-        
         # Generate Mermaid diagrams
-        diagram_path = diagrams_dir / "components.mmd"
+        diagram_path = self._diagrams_dir / "components.mmd"
+        fp = self._fingerprint(self.config.get('components'))
+        if self._is_current(diagram_path, fp):
+            return
         
-        with open(diagram_path, 'w') as f:
-            f.write("graph TD\n")
-            
-            # Add components and relationships
-            for component in self.config.get('components', []):
-                f.write(f"    {component['id']}[{component['name']}]\n")
-                
-                # Add relationships
-                for rel in component.get('relationships', []):
-                    f.write(f"    {component['id']} --> {rel['target']}\n")
+        # Add components and relationships
+        components = self.config.get('components', [])
+        edges = chain.from_iterable(
+            ((component['id'], rel['target']) for rel in component.get('relationships', []))
+            for component in components
+        )
+        self._write_doc(diagram_path, fp, self._render_graph("graph TD", components, edges))
 
     def _generate_sequence_diagrams(self) -> None:
         """Generate sequence diagrams."""
-        diagrams_dir = self.docs_dir / "architecture" / "diagrams"
-        os.makedirs(diagrams_dir, exist_ok=True)
-        
         # Generate Mermaid sequence diagrams
-        diagram_path = diagrams_dir / "sequences.mmd"
+        diagram_path = self._diagrams_dir / "sequences.mmd"
+        fp = self._fingerprint(self.config.get('participants'), self.config.get('interactions'))
+        if self._is_current(diagram_path, fp):
+            return
         
-        with open(diagram_path, 'w') as f:
-            f.write("sequenceDiagram\n")
-            
-            # Add participants
-            for participant in self.config.get('participants', []):
-                f.write(f"    participant {participant['id']} as {participant['name']}\n")
-            
-            # Add interactions
-            for interaction in self.config.get('interactions', []):
-                f.write(f"    {interaction['source']} ->> {interaction['target']}: {interaction['message']}\n")
+        parts = ["sequenceDiagram\n"]
+        
+        # Add participants
+        parts.extend(
+            f"    participant {participant['id']} as {participant['name']}\n"
+            for participant in self.config.get('participants', [])
+        )
+        
+        # Add interactions
+        parts.extend(
+            f"    {interaction['source']} ->> {interaction['target']}: {interaction['message']}\n"
+            for interaction in self.config.get('interactions', [])
+        )
+        
+        self._write_doc(diagram_path, fp, "".join(parts))
 
     def _generate_system_context_diagram(self) -> None:
         """Generate system context diagram."""
-        diagrams_dir = self.docs_dir / "architecture" / "diagrams"
-        os.makedirs(diagrams_dir, exist_ok=True)
-        
         # Generate Mermaid system context diagram
-        diagram_path = diagrams_dir / "system_context.mmd"
+        diagram_path = self._diagrams_dir / "system_context.mmd"
+        fp = self._fingerprint(self.config.get('system_context'))
+        if self._is_current(diagram_path, fp):
+            return
         
-        with open(diagram_path, 'w') as f:
-            f.write("graph LR\n")
-            
-            # Add system context
-            for context in self.config.get('system_context', []):
-                f.write(f"    {context['id']}[{context['name']}]\n")
-                
-                # Add relationships
-                for rel in context.get('relationships', []):
-                    f.write(f"    {context['id']} --> {rel['target']}\n")
+        # Add system context and relationships
+        contexts = self.config.get('system_context', [])
+        edges = chain.from_iterable(
+            ((context['id'], rel['target']) for rel in context.get('relationships', []))
+            for context in contexts
+        )
+        self._write_doc(diagram_path, fp, self._render_graph("graph LR", contexts, edges))
 
     def generate_deployment_docs(self) -> None:
         """Generate deployment documentation."""
         logger.info("Generating deployment documentation...")
         
-        deploy_dir = self.docs_dir / "deployment"
-        os.makedirs(deploy_dir, exist_ok=True)
+        self._deploy_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate deployment guides
         self._generate_cloud_guide()
@@ -227,89 +382,115 @@ class DocumentationGenerator:
         self._generate_backup_guide()
         self._generate_upgrade_guide()
         
+        self._save_doc_cache()
         logger.info("Deployment documentation generation complete")
 
     def _generate_cloud_guide(self) -> None:
         """Generate cloud deployment guide."""
-        guide_path = self.docs_dir / "deployment" / "cloud_guide.md"
+        guide_path = self._deploy_dir / "cloud_guide.md"
+        fp = self._fingerprint(self.config.get('cloud_providers'))
+        if self._is_current(guide_path, fp):
+            return
+        
+        parts = ["# Cloud Deployment Guide\n\n"]
         
-        with open(guide_path, 'w') as f:
-            f.write("# Cloud Deployment Guide\n\n")
+        # Add cloud providers
+        for provider in self.config.get('cloud_providers', []):
+            parts.append(f"## {provider['name']}\n\n{provider['description']}\n\n")
             
-            # Add cloud providers
-            for provider in self.config.get('cloud_providers', []):
-                f.write(f"## {provider['name']}\n\n")
-                f.write(f"{provider['description']}\n\n")
-                
-                # Add steps
-                f.write("### Steps\n")
-                for step in provider.get('steps', []):
-                    f.write(f"1. {step}\n")
+            # Add steps
+            parts.append("### Steps\n")
+            parts.extend(f"1. {step}\n" for step in provider.get('steps', []))
+            
+        self._write_doc(guide_path, fp, "".join(parts))
 
     def _generate_k8s_guide(self) -> None:
         """Generate Kubernetes deployment guide."""
-        guide_path = self.docs_dir / "deployment" / "k8s_guide.md"
+        guide_path = self._deploy_dir / "k8s_guide.md"
+        fp = self._fingerprint(self.config.get('k8s_components'))
+        if self._is_current(guide_path, fp):
+            return
         
-        with open(guide_path, 'w') as f:
-            f.write("# Kubernetes Deployment Guide\n\n")
+        parts = ["# Kubernetes Deployment Guide\n\n"]
+        
+        # Add Kubernetes components
+        for component in self.config.get('k8s_components', []):
+            parts.append(f"## {component['name']}\n\n{component['description']}\n\n")
             
-            # Add Kubernetes components
-            for component in self.config.get('k8s_components', []):
-                f.write(f"## {component['name']}\n\n")
-                f.write(f"{component['description']}\n\n")
-                
-                # Add configuration
-                f.write("### Configuration\n")
-                f.write(f"```yaml\n")
-                f.write(f"{component.get('config', '')}\n")
-                f.write("```\n\n")
+            # Add configuration
+            parts.append(f"### Configuration\n```yaml\n{component.get('config', '')}\n```\n\n")
+            
+        self._write_doc(guide_path, fp, "".join(parts))
 
     def _generate_backup_guide(self) -> None:
         """Generate backup guide."""
-        guide_path = self.docs_dir / "deployment" / "backup_guide.md"
+        guide_path = self._deploy_dir / "backup_guide.md"
+        fp = self._fingerprint(self.config.get('backup_strategies'))
+        if self._is_current(guide_path, fp):
+            return
+        
+        parts = ["# Backup Guide\n\n"]
         
-        with open(guide_path, 'w') as f:
-            f.write("# Backup Guide\n\n")
+        # Add backup strategies
+        for strategy in self.config.get('backup_strategies', []):
+            parts.append(f"## {strategy['name']}\n\n{strategy['description']}\n\n")
             
-            # Add backup strategies
-            for strategy in self.config.get('backup_strategies', []):
-                f.write(f"## {strategy['name']}\n\n")
-                f.write(f"{strategy['description']}\n\n")
-                
-                # Add procedures
-                f.write("### Procedure\n")
-                for step in strategy.get('procedure', []):
-                    f.write(f"1. {step}\n")
+            # Add procedures
+            parts.append("### Procedure\n")
+            parts.extend(f"1. {step}\n" for step in strategy.get('procedure', []))
+            
+        self._write_doc(guide_path, fp, "".join(parts))
 
     def _generate_upgrade_guide(self) -> None:
         """Generate upgrade guide."""
-        guide_path = self.docs_dir / "deployment" / "upgrade_guide.md"
+        guide_path = self._deploy_dir / "upgrade_guide.md"
+        fp = self._fingerprint(self.config.get('upgrade_steps'))
+        if self._is_current(guide_path, fp):
+            return
+        
+        parts = ["# Upgrade Guide\n\n"]
         
-        with open(guide_path, 'w') as f:
-            f.write("# Upgrade Guide\n\n")
+        # Add upgrade steps
+        for step in self.config.get('upgrade_steps', []):
+            parts.append(f"## {step['version']}\n\n{step['description']}\n\n")
             
-            # Add upgrade steps
-            for step in self.config.get('upgrade_steps', []):
-                f.write(f"## {step['version']}\n\n")
-                f.write(f"{step['description']}\n\n")
-                
-                # Add procedures
-                f.write("### Procedure\n")
-                for procedure in step.get('procedure', []):
-                    f.write(f"1. {procedure}\n")
+            # Add procedures
+            parts.append("### Procedure\n")
+            parts.extend(f"1. {procedure}\n" for procedure in step.get('procedure', []))
+            
+        self._write_doc(guide_path, fp, "".join(parts))
 
     def generate_all(self) -> None:
         """Generate all documentation."""
         logger.info("Generating all documentation...")
         
-        # Create docs directory
-        os.makedirs(self.docs_dir, exist_ok=True)
-        
-        # Generate all documentation
-        self.generate_api_docs()
-        self.generate_architecture_docs()
-        self.generate_deployment_docs()
+        # Create every output directory up front so the generators below
+        # only write files
+        self.api_dir.mkdir(parents=True, exist_ok=True)
+        self._diagrams_dir.mkdir(parents=True, exist_ok=True)
+        self._deploy_dir.mkdir(parents=True, exist_ok=True)
         
+        # Generate all documentation; every generator writes its own file,
+        # so they can run concurrently
+        tasks = [
+            self._generate_api_reference,
+            self._generate_swagger_docs,
+            self._generate_api_examples,
+            self._generate_api_changelog,
+            self._generate_architecture_overview,
+            self._generate_component_diagrams,
+            self._generate_sequence_diagrams,
+            self._generate_system_context_diagram,
+            self._generate_cloud_guide,
+            self._generate_k8s_guide,
+            self._generate_backup_guide,
+            self._generate_upgrade_guide
+        ]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # list() re-raises the first failure
+            list(executor.map(lambda task: task(), tasks))
+            
+        self._save_doc_cache()
         logger.info("All documentation generation complete")
 
 if __name__ == "__main__":
@@ -4,24 +4,79 @@ import aiohttp
 from typing import Dict, List, Optional
 import yaml
 import json
+import time
 from datetime import datetime
 import prometheus_client
 from prometheus_client import Counter, Gauge, Histogram, Summary
 import opentracing
 from jaeger_client import Config as JaegerConfig
 
+# libyaml's C loader parses several times faster than the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# Fraction of traces recorded by the Jaeger sampler
+TRACE_SAMPLE_RATE = 0.01
+
+def _aggregate_endpoints(integrations: Dict) -> tuple:
+    """Count total and successful endpoints across all services.
+
+    Returns:
+        (total, successful) endpoint counts
+    """
+    total = 0
+    successful = 0
+    for service in integrations.values():
+        endpoints = service['endpoints']
+        total += len(endpoints)
+        for endpoint in endpoints:
+            if endpoint['status'] == 'success':
+                successful += 1
+    return total, successful
+
+# Fixed fields of a slow-endpoint alert; per-alert fields are merged in
+_SLOW_TPL = {
+    'severity': 'warning',
+    'description': None,
+    'value': None,
+    'threshold': None
+}
+
+def _iso(ts: Optional[float]) -> Optional[str]:
+    """Format an epoch timestamp as a local ISO-8601 string."""
+    return datetime.fromtimestamp(ts).isoformat() if ts is not None else None
+
+def _with_iso_times(result: Dict, **overrides) -> Dict:
+    """Copy a service/endpoint result with its timestamps as ISO strings."""
+    return {
+        **result,
+        'start_time': _iso(result['start_time']),
+        'end_time': _iso(result['end_time']),
+        **overrides
+    }
+
 class IntegrationManager:
     def __init__(self, config_file: str = "integration_config.yaml"):
         self.config = self._load_config(config_file)
-        self.session = aiohttp.ClientSession()
+        self._session = None
+        self._sem = None
         self.metrics = self._initialize_metrics()
+        self._metric_children = {}
         self.tracer = self._initialize_tracer()
+        self._totals = (0, 0)
         self.results = {
             'integrations': {},
             'metrics': {},
@@ -32,7 +87,52 @@ class IntegrationManager:
     def _load_config(self, config_file: str) -> Dict:
         """Load integration configuration."""
         with open(config_file) as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_YamlLoader)
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """HTTP session, created on first use inside the running loop.
+
+        The connector bounds open sockets overall and per host and keeps
+        connections alive between requests to the same service.
+        """
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    limit_per_host=16,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30,
+                    enable_cleanup_closed=True
+                ),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._session
+
+    @property
+    def request_slots(self) -> asyncio.Semaphore:
+        """Semaphore capping in-flight endpoint requests.
+        
+        Created lazily inside the running loop and dropped along with the
+        session, so each run gets one bound to its own loop.
+        """
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(32)
+        return self._sem
+
+    async def __aenter__(self) -> "IntegrationManager":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP session if one was opened."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        # Semaphores bind to the running loop on Python < 3.10
+        self._sem = None
 
     def _initialize_metrics(self) -> Dict:
         """Initialize Prometheus metrics."""
@@ -62,8 +162,8 @@ class IntegrationManager:
         config = JaegerConfig(
             config={
                 'sampler': {
-                    'type': 'const',
-                    'param': 1,
+                    'type': 'probabilistic',
+                    'param': TRACE_SAMPLE_RATE,
                 },
                 'local_agent': {
                     'reporting_host': 'jaeger-agent.orchestratex.svc.cluster.local',
@@ -81,28 +181,30 @@ class IntegrationManager:
         span = self._start_trace("integration")
         
         try:
-            # Process services concurrently
-            service_tasks = [
-                self._process_service(service)
-                for service in self.config['services']['external'] +
-                self.config['services']['internal']
-            ]
-            
-            service_results = await asyncio.gather(*service_tasks)
-            
-            # Calculate metrics
-            self._calculate_metrics()
-            
-            # Generate integration report
-            self._generate_report()
-            
-            # Check alerts
-            self._check_alerts()
-            
-            # Send notifications
-            await self._send_notifications()
-            
-            return self.results
+            # The session is opened for this run only and closed on exit
+            async with self.session:
+                # Process services concurrently
+                service_tasks = [
+                    self._process_service(service)
+                    for service in self.config['services']['external'] +
+                    self.config['services']['internal']
+                ]
+                
+                service_results = await asyncio.gather(*service_tasks)
+                
+                # Calculate metrics
+                self._calculate_metrics()
+                
+                # Generate integration report
+                self._generate_report()
+                
+                # Check alerts
+                self._check_alerts()
+                
+                # Send notifications
+                await self._send_notifications()
+                
+                return self.results
             
         except Exception as e:
             logger.error(f"Integration management failed: {str(e)}")
@@ -112,6 +214,8 @@ class IntegrationManager:
             
         finally:
             span.finish()
+            self._session = None
+            self._sem = None
 
     async def _process_service(self, service: Dict) -> Dict:
         """Process a single service."""
@@ -120,10 +224,20 @@ class IntegrationManager:
             'description': service['description'],
             'endpoints': [],
             'status': 'running',
-            'start_time': datetime.now().isoformat(),
+            'start_time': time.time(),
             'end_time': None,
             'duration': None
         }
+        start = time.perf_counter()
+        
+        # Trace names and label-bound metrics are resolved once per
+        # endpoint, not per request
+        for endpoint in service['endpoints']:
+            if '_trace_name' not in endpoint:
+                endpoint['_trace_name'] = f"endpoint_{endpoint['name']}"
+                endpoint['_lat'], endpoint['_tp'], endpoint['_err'] = self._endpoint_metrics(
+                    service['name'], endpoint['name']
+                )
         
         # Process endpoints concurrently
         endpoint_tasks = [
@@ -140,12 +254,10 @@ class IntegrationManager:
         else:
             service_result['status'] = 'success'
         
-        # Update service duration
-        service_result['end_time'] = datetime.now().isoformat()
-        service_result['duration'] = (
-            datetime.fromisoformat(service_result['end_time']) -
-            datetime.fromisoformat(service_result['start_time'])
-        ).total_seconds()
+        # Update service duration; timestamps are epoch seconds, converted
+        # to ISO strings only when the report is written
+        service_result['end_time'] = time.time()
+        service_result['duration'] = time.perf_counter() - start
         
         return service_result
 
@@ -155,71 +267,73 @@ class IntegrationManager:
             'name': endpoint['name'],
             'url': endpoint['url'],
             'status': 'running',
-            'start_time': datetime.now().isoformat(),
+            'start_time': time.time(),
             'end_time': None,
             'duration': None,
             'response_time': None,
             'error': None
         }
+        start = time.perf_counter()
         
         # Start endpoint trace
-        span = self._start_trace(f"endpoint_{endpoint['name']}")
+        span = self._start_trace(endpoint['_trace_name'])
         
         try:
             # Make request with authentication
             auth = self._get_auth(endpoint['auth'])
-            async with self.session.get(
-                endpoint['url'],
-                auth=auth,
-                timeout=30
-            ) as response:
-                # Record metrics
-                response_time = response.time
-                self.metrics['service_latency'].labels(
-                    service=service_name,
-                    endpoint=endpoint['name']
-                ).observe(response_time)
-                
-                self.metrics['service_throughput'].labels(
-                    service=service_name,
-                    endpoint=endpoint['name']
-                ).inc()
-                
-                if response.status != 200:
-                    self.metrics['service_errors'].labels(
-                        service=service_name,
-                        endpoint=endpoint['name']
-                    ).inc()
+            async with self.request_slots:
+                request_start = time.perf_counter()
+                async with self.session.get(
+                    endpoint['url'],
+                    auth=auth
+                ) as response:
+                    # Record metrics; response time is time to headers
+                    response_time = time.perf_counter() - request_start
+                    endpoint_result['response_time'] = response_time
+                    endpoint['_lat'].observe(response_time)
+                    endpoint['_tp'].inc()
                     
-                    raise Exception(f"Endpoint {endpoint['name']} failed: {response.status}")
-                
-                endpoint_result['status'] = 'success'
+                    if response.status != 200:
+                        raise Exception(f"Endpoint {endpoint['name']} failed: {response.status}")
+                    
+                    endpoint_result['status'] = 'success'
                 
         except Exception as e:
             endpoint_result['status'] = 'failed'
             endpoint_result['error'] = str(e)
             
             # Record error
-            self.metrics['service_errors'].labels(
-                service=service_name,
-                endpoint=endpoint['name']
-            ).inc()
+            endpoint['_err'].inc()
             
         finally:
-            # Update endpoint duration
-            endpoint_result['end_time'] = datetime.now().isoformat()
-            endpoint_result['duration'] = (
-                datetime.fromisoformat(endpoint_result['end_time']) -
-                datetime.fromisoformat(endpoint_result['start_time'])
-            ).total_seconds()
+            # Update endpoint duration; timestamps are for reporting only
+            endpoint_result['duration'] = time.perf_counter() - start
+            endpoint_result['end_time'] = time.time()
             
-            # Update response time
-            endpoint_result['response_time'] = endpoint_result['duration']
+            # Requests that never got a response count their time to failure
+            if endpoint_result['response_time'] is None:
+                endpoint_result['response_time'] = endpoint_result['duration']
             
             span.finish()
             
         return endpoint_result
 
+    def _endpoint_metrics(self, service_name: str, endpoint_name: str) -> tuple:
+        """Get the label-bound latency, throughput and error metrics.
+        
+        Returns:
+            (latency, throughput, errors) children for this endpoint
+        """
+        key = (service_name, endpoint_name)
+        children = self._metric_children.get(key)
+        if children is None:
+            children = tuple(
+                self.metrics[name].labels(service=service_name, endpoint=endpoint_name)
+                for name in ('service_latency', 'service_throughput', 'service_errors')
+            )
+            self._metric_children[key] = children
+        return children
+
     def _get_auth(self, auth_config: Dict) -> aiohttp.BasicAuth:
         """Get appropriate authentication for endpoint."""
         if auth_config['type'] == 'basic':
@@ -244,92 +358,106 @@ class IntegrationManager:
 
     def _calculate_metrics(self) -> None:
         """Calculate integration metrics."""
-        # Calculate service health scores
-        total_endpoints = sum(
-            len(service['endpoints'])
-            for service in self.results['integrations'].values()
-        )
-        successful_endpoints = sum(
-            1 for service in self.results['integrations'].values()
-            for endpoint in service['endpoints']
-            if endpoint['status'] == 'success'
-        )
+        # Calculate service health scores; the counts are kept for the report
+        total_endpoints, successful_endpoints = _aggregate_endpoints(self.results['integrations'])
+        self._totals = (total_endpoints, successful_endpoints)
         health_score = (successful_endpoints / total_endpoints) * 100 if total_endpoints > 0 else 0.0
         
         self.results['metrics']['service_health'] = health_score
 
     def _generate_report(self) -> None:
         """Generate integration report."""
+        # Counted by _calculate_metrics, which always runs first
+        total_endpoints, healthy_endpoints = self._totals
         report = {
             'timestamp': datetime.now().isoformat(),
-            'integrations': self.results['integrations'],
+            'integrations': {
+                name: _with_iso_times(service, endpoints=[
+                    _with_iso_times(endpoint) for endpoint in service['endpoints']
+                ])
+                for name, service in self.results['integrations'].items()
+            },
             'metrics': self.results['metrics'],
             'alerts': self.results['alerts'],
             'summary': {
                 'total_services': len(self.results['integrations']),
-                'total_endpoints': sum(
-                    len(service['endpoints'])
-                    for service in self.results['integrations'].values()
-                ),
-                'healthy_endpoints': sum(
-                    1 for service in self.results['integrations'].values()
-                    for endpoint in service['endpoints']
-                    if endpoint['status'] == 'success'
-                ),
+                'total_endpoints': total_endpoints,
+                'healthy_endpoints': healthy_endpoints,
                 'health_score': self.results['metrics']['service_health']
             }
         }
         
-        # Save report
-        with open('integration_report.json', 'w') as f:
-            json.dump(report, f, indent=2)
+        # Save report in one write, serialized by orjson when available
+        if orjson is not None:
+            payload = orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            payload = json.dumps(report, indent=2).encode('utf-8')
+        with open('integration_report.json', 'wb') as f:
+            f.write(payload)
 
     def _check_alerts(self) -> None:
         """Check for alerts based on integration results."""
+        rules = self.config['alerts']['rules']
+        hs_threshold = rules['service_health']['threshold']
+        rt_threshold = rules['response_time']['threshold']
+        
         # Check health score
         health_score = self.results['metrics']['service_health']
-        if health_score < self.config['alerts']['rules']['service_health']['threshold']:
+        if health_score < hs_threshold:
             self.results['alerts'].append({
                 'severity': 'critical',
                 'description': 'Low service health score',
                 'value': health_score,
-                'threshold': self.config['alerts']['rules']['service_health']['threshold']
+                'threshold': hs_threshold
             })
         
         # Check response times
-        for service in self.results['integrations'].values():
-            for endpoint in service['endpoints']:
-                if endpoint['response_time'] > self.config['alerts']['rules']['response_time']['threshold']:
-                    self.results['alerts'].append({
-                        'severity': 'warning',
-                        'description': f'Slow response time for {endpoint['name']}',
-                        'value': endpoint['response_time'],
-                        'threshold': self.config['alerts']['rules']['response_time']['threshold']
-                    })
+        self.results['alerts'].extend(
+            {
+                **_SLOW_TPL,
+                'description': f"Slow response time for {endpoint['name']}",
+                'value': endpoint['response_time'],
+                'threshold': rt_threshold
+            }
+            for service in self.results['integrations'].values()
+            for endpoint in service['endpoints']
+            if endpoint['response_time'] > rt_threshold
+        )
 
     async def _send_notifications(self) -> None:
-        """Send integration notifications."""
-        for alert in self.results['alerts']:
-            await self._send_alert(alert)
-
-    async def _send_alert(self, alert: Dict) -> None:
-        """Send an alert notification."""
-        for channel in self.config['notifications']['channels']:
-            if channel['type'] == 'slack':
-                await self._send_slack_alert(alert, channel)
-            elif channel['type'] == 'email':
-                await self._send_email_alert(alert, channel)
-            elif channel['type'] == 'pagerduty':
-                await self._send_pagerduty_alert(alert, channel)
-
-    async def _send_slack_alert(self, alert: Dict, channel: Dict) -> None:
-        """Send Slack alert notification."""
+        """Send integration notifications.
+        
+        Each channel receives all alerts in one batch, and channels are
+        notified concurrently.
+        """
+        alerts = self.results['alerts']
+        if not alerts:
+            return
+            
+        senders = {
+            'slack': self._send_slack_bulk,
+            'email': self._send_email_bulk,
+            'pagerduty': self._send_pagerduty_bulk
+        }
+        await asyncio.gather(*(
+            senders[channel['type']](alerts, channel)
+            for channel in self.config['notifications']['channels']
+            if channel['type'] in senders
+        ))
+
+    async def _send_slack_bulk(self, alerts: List[Dict], channel: Dict) -> None:
+        """Send all alerts to Slack as one message with one attachment each."""
         webhook = channel.get('webhook')
         if not webhook:
             return
 
+        if len(alerts) == 1:
+            text = f"Integration Alert: {alerts[0]['severity']} - {alerts[0]['description']}"
+        else:
+            text = f"Integration Alerts: {len(alerts)} alerts"
+            
         payload = {
-            "text": f"Integration Alert: {alert['severity']} - {alert['description']}",
+            "text": text,
             "attachments": [
                 {
                     "color": "danger" if alert['severity'] == 'critical' else "warning",
@@ -352,6 +480,7 @@ class IntegrationManager:
                         }
                     ]
                 }
+                for alert in alerts
             ]
         }
 
@@ -359,8 +488,8 @@ class IntegrationManager:
             if response.status != 200:
                 logger.error(f"Failed to send Slack alert: {response.status}")
 
-    async def _send_email_alert(self, alert: Dict, channel: Dict) -> None:
-        """Send email alert notification."""
+    async def _send_email_bulk(self, alerts: List[Dict], channel: Dict) -> None:
+        """Send all alerts in a single email notification."""
         recipients = channel.get('recipients', [])
         if not recipients:
             return
@@ -368,17 +497,24 @@ class IntegrationManager:
         # Implementation of email sending
         pass
 
-    async def _send_pagerduty_alert(self, alert: Dict, channel: Dict) -> None:
-        """Send PagerDuty alert notification."""
+    async def _send_pagerduty_bulk(self, alerts: List[Dict], channel: Dict) -> None:
+        """Send PagerDuty alert notifications."""
         service_key = channel.get('service_key')
         if not service_key:
             return
 
-        # Implementation of PagerDuty sending
+        # Implementation of PagerDuty sending; the Events API takes one
+        # event per request, so alerts would be posted concurrently here
         pass
 
     def _start_trace(self, operation_name: str) -> opentracing.Span:
-        """Start a new trace."""
+        """Start a new trace.
+        
+        The tracer's probabilistic sampler makes the only sampling decision;
+        unsampled spans are never reported. Don't pre-sample here: a second
+        draw would square the rate, and forcing sampling.priority marks
+        every kept trace as debug.
+        """
         tracer = opentracing.global_tracer()
         return tracer.start_span(operation_name)
 
@@ -1,8 +1,50 @@
+import asyncio
+import hashlib
+import json
+import os
+import re
 import subprocess
 import logging
+from functools import cached_property
 from pathlib import Path
-import yaml
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
+
+try:
+    from importlib.metadata import version as _dist_version, PackageNotFoundError
+except ImportError:  # Python < 3.8
+    _dist_version = None
+    PackageNotFoundError = Exception
+
+try:
+    import pathspec
+except ImportError:
+    pathspec = None
+
+try:
+    import pywatchman
+except ImportError:
+    pywatchman = None
+
+# Formatter libraries, run in-process when importable
+try:
+    import black
+except ImportError:
+    black = None
+
+try:
+    import isort
+except ImportError:
+    isort = None
+
+try:
+    import autopep8
+except ImportError:
+    autopep8 = None
+
+try:
+    from yapf.yapflib import yapf_api
+except ImportError:
+    yapf_api = None
 
 logging.basicConfig(
     level=logging.INFO,
@@ -10,9 +52,64 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Directories never handed to the formatters
+_SKIP_DIRS = {'.git', '.tox', '.venv', 'venv', '__pycache__', 'build', 'dist', 'node_modules'}
+
+# Most files passed on one command line; a conservative share of ARG_MAX
+# so long paths and the environment still fit
+try:
+    _MAX_FILE_ARGS = max(os.sysconf('SC_ARG_MAX') // 256, 64)
+except (AttributeError, ValueError, OSError):  # Windows has no sysconf
+    _MAX_FILE_ARGS = 128
+
+def _tool_version(tool: str) -> str:
+    """Installed version of a formatter, read from package metadata."""
+    if _dist_version is None:
+        return 'unknown'
+    try:
+        return _dist_version(tool)
+    except PackageNotFoundError:
+        return 'unknown'
+
+# "file:line:col: message" diagnostics from flake8
+_FLAKE8_RE = re.compile(r'^([^:]+):(\d+):(\d+):\s*(.*)$')
+
+# "would reformat <path>" lines from black --check
+_BLACK_RE = re.compile(r'^would reformat (.+)$', re.M)
+
+def _parse_flake8_line(line: str) -> Optional[Dict]:
+    """Parse one line of flake8 output into an issue."""
+    match = _FLAKE8_RE.match(line)
+    if match is None:
+        return None
+    return {
+        'formatter': 'flake8',
+        'file': match[1],
+        'line': int(match[2]),
+        'column': int(match[3]),
+        'message': match[4]
+    }
+
 class CodeFormatter:
-    def __init__(self, project_root: str = os.getcwd()):
+    # Formatters that rewrite files; they must not run alongside each other
+    # or alongside the checkers, which would read half-written files
+    IN_PLACE = ('autopep8', 'yapf')
+
+    CACHE_FILE = '.orchestratex_fmt_cache.json'
+
+    # Watchman clock and still-failing files from the previous run
+    STATE_FILE = '.orchestratex_fmt_state.json'
+
+    def __init__(self, project_root: str = os.getcwd(), use_cli: bool = False):
+        """Initialize the formatter.
+        
+        Args:
+            project_root: Directory to format
+            use_cli: Always shell out to the formatter executables instead of
+                calling importable formatter libraries in-process
+        """
         self.project_root = Path(project_root)
+        self.use_cli = use_cli
         self.formatters = {
             'black': self._run_black,
             'isort': self._run_isort,
@@ -21,146 +118,428 @@ class CodeFormatter:
             'yapf': self._run_yapf
         }
         self.results: Dict[str, Dict] = {}
+        # "tool:version:digest" keys of files a tool last found clean
+        self._cache_path = self.project_root / self.CACHE_FILE
+        self._clean = self._load_cache()
+        self._versions: Dict[str, str] = {}
+        # Python files for the current run, shared by every tool
+        self._files: Optional[List[Path]] = None
+        self._state_path = self.project_root / self.STATE_FILE
+        self._state = self._load_state()
+        self._clock: Optional[str] = None
+        self._run_tools: Dict[str, str] = {}
+        # Per tool, files not yet found clean this run
+        self._pending: Dict[str, set] = {}
+
+    def _load_cache(self) -> set:
+        """Load the set of (tool, version, content hash) entries known clean."""
+        try:
+            with open(self._cache_path) as f:
+                return set(json.load(f))
+        except (FileNotFoundError, ValueError):
+            return set()
+
+    def _save_cache(self) -> None:
+        """Atomically write the clean-file cache."""
+        temp_path = self._cache_path.with_name(self._cache_path.name + '.tmp')
+        temp_path.write_text(json.dumps(sorted(self._clean)))
+        os.replace(temp_path, self._cache_path)
 
-    def format_code(self, formatters: Optional[List[str]] = None) -> Dict[str, Dict]:
-        """Format code using specified formatters."""
+    def _load_state(self) -> Dict:
+        """Load the previous run's watchman state, if any."""
+        try:
+            with open(self._state_path) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save_state(self) -> None:
+        """Atomically record this run's clock, tools and unresolved files."""
+        pending = set().union(*self._pending.values())
+        state = {
+            'clock': self._clock,
+            'tools': self._run_tools,
+            'pending': sorted(os.path.relpath(path, self.project_root) for path in pending)
+        }
+        temp_path = self._state_path.with_name(self._state_path.name + '.tmp')
+        temp_path.write_text(json.dumps(state))
+        os.replace(temp_path, self._state_path)
+        self._state = state
+
+    def _watchman_changes(self) -> Optional[List[str]]:
+        """Relative .py paths watchman saw change since the previous run.
+        
+        Records the current clock for the next run. Returns None when the
+        whole tree must be walked instead: the project has no
+        .watchmanconfig, watchman is unavailable, or the previous run is
+        unknown or used different tools or tool versions.
+        """
+        if pywatchman is None or not (self.project_root / '.watchmanconfig').exists():
+            return None
+        try:
+            client = pywatchman.client()
+            try:
+                watch = client.query('watch-project', str(self.project_root))
+                since = self._state.get('clock')
+                if not since or self._state.get('tools') != self._run_tools:
+                    self._clock = client.query('clock', watch['watch'])['clock']
+                    return None
+                    
+                query = {
+                    'since': since,
+                    'fields': ['name', 'exists'],
+                    'expression': ['suffix', 'py']
+                }
+                if 'relative_path' in watch:
+                    query['relative_root'] = watch['relative_path']
+                result = client.query('query', watch['watch'], query)
+            finally:
+                client.close()
+        except Exception as e:
+            logger.warning(f"watchman query failed, scanning the whole tree: {str(e)}")
+            self._clock = None
+            return None
+            
+        self._clock = result['clock']
+        if result.get('is_fresh_instance'):
+            # Watchman restarted and can't say what changed
+            return None
+        return [f['name'] for f in result['files'] if f['exists']]
+
+    def _ignore_spec(self):
+        """Patterns from the project's .gitignore, if pathspec is installed."""
+        gitignore = self.project_root / '.gitignore'
+        if pathspec is None or not gitignore.is_file():
+            return None
+        with open(gitignore) as f:
+            return pathspec.PathSpec.from_lines('gitwildmatch', f)
+
+    def _collect_files(self) -> List[Path]:
+        """.py files under the project root to consider this run.
+        
+        Skips tool/build directories and anything matched by .gitignore.
+        With watchman, only files changed since the previous run plus those
+        it left unresolved; otherwise every file, walked once per run.
+        """
+        if self._files is None:
+            spec = self._ignore_spec()
+            root = str(self.project_root)
+            changed = self._watchman_changes()
+            if changed is not None:
+                candidates = set(changed).union(self._state.get('pending', []))
+                self._files = [
+                    Path(root, name) for name in sorted(candidates)
+                    if not _SKIP_DIRS.intersection(Path(name).parts[:-1])
+                    and not (spec and spec.match_file(name))
+                    and Path(root, name).is_file()
+                ]
+                return self._files
+                
+            files = []
+            to_visit = [root]
+            while to_visit:
+                with os.scandir(to_visit.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name in _SKIP_DIRS:
+                                continue
+                            if spec and spec.match_file(os.path.relpath(entry.path, root) + '/'):
+                                continue
+                            to_visit.append(entry.path)
+                        elif entry.name.endswith('.py'):
+                            if spec and spec.match_file(os.path.relpath(entry.path, root)):
+                                continue
+                            files.append(Path(entry.path))
+            self._files = files
+        return self._files
+
+    def _version(self, tool: str) -> str:
+        """Installed version of a tool, looked up once."""
+        if tool not in self._versions:
+            self._versions[tool] = _tool_version(tool)
+        return self._versions[tool]
+
+    def _cache_key(self, tool: str, path: Path) -> str:
+        """Cache key for a file's current contents under a tool version."""
+        digest = hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+        return f"{tool}:{self._version(tool)}:{digest}"
+
+    def _dirty_files(self, tool: str) -> List[Path]:
+        """Files whose current contents the tool hasn't already passed."""
+        dirty = [
+            path for path in self._collect_files()
+            if self._cache_key(tool, path) not in self._clean
+        ]
+        self._pending[tool] = set(dirty)
+        return dirty
+
+    def _mark_clean(self, tool: str, files: List[Path]) -> None:
+        """Record files as clean for a tool, keyed by their current contents."""
+        self._clean.update(self._cache_key(tool, path) for path in files)
+        self._pending.get(tool, set()).difference_update(files)
+        self._save_cache()
+
+    async def format_code(self, formatters: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """Format code using specified formatters.
+        
+        Read-only checkers run concurrently; in-place formatters then run
+        one at a time in the order given. Each tool's files are split across
+        up to one process per core.
+        """
         if formatters is None:
             formatters = list(self.formatters.keys())
 
+        selected = []
         for formatter in formatters:
             if formatter in self.formatters:
-                logger.info(f"Running {formatter} formatter...")
-                result = self.formatters[formatter]()
-                self.results[formatter] = result
+                selected.append(formatter)
             else:
                 logger.warning(f"Formatter {formatter} not available")
+                
+        # Walk the tree afresh for each run
+        self._files = None
+        self._clock = None
+        self._pending = {}
+        self._run_tools = {tool: self._version(tool) for tool in selected}
+        
+        # Caps formatter processes across all tools at one per core
+        self._proc_slots = asyncio.Semaphore(os.cpu_count() or 1)
+        
+        checkers = [f for f in selected if f not in self.IN_PLACE]
+        rewriters = [f for f in selected if f in self.IN_PLACE]
+        
+        for formatter in checkers:
+            logger.info(f"Running {formatter} formatter...")
+        results = await asyncio.gather(
+            *(self.formatters[f]() for f in checkers),
+            return_exceptions=True
+        )
+        for formatter, result in zip(checkers, results):
+            if isinstance(result, BaseException):
+                result = {'status': 'error', 'error': str(result)}
+            self.results[formatter] = result
+            
+        for formatter in rewriters:
+            logger.info(f"Running {formatter} formatter...")
+            self.results[formatter] = await self.formatters[formatter]()
+            
+        # A tool that failed before listing its files leaves its state
+        # unknown, so the next run must walk everything again
+        if self._clock is not None and self._pending.keys() == self._run_tools.keys():
+            self._save_state()
 
         return self.results
 
-    def _run_black(self) -> Dict:
-        """Run Black formatter."""
+    def format_code_sync(self, formatters: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """Run format_code from synchronous code."""
+        return asyncio.run(self.format_code(formatters))
+
+    async def _run_tool(self, tool: str, args: List[str],
+                        check: Optional[Callable[[Path], Optional[str]]] = None,
+                        parse: Optional[Callable[[str], Optional[Dict]]] = None) -> Dict:
+        """Run a formatter on the files it hasn't already passed.
+        
+        Args:
+            tool: Executable name
+            args: Options placed before the file list
+            check: In-process equivalent of the CLI, called per file and
+                returning a problem message or None; None to always use the CLI
+            parse: Turns one line of CLI stdout into an issue dict or None.
+                When given, stdout is parsed as it streams in and the result
+                carries 'issues' instead of the raw output
+        """
         try:
-            result = subprocess.run(
-                ['black', str(self.project_root), '--check'],
-                capture_output=True,
-                text=True
-            )
-            return {
-                'status': 'success' if result.returncode == 0 else 'failed',
-                'output': result.stdout,
-                'errors': result.stderr
+            dirty = self._dirty_files(tool)
+            if not dirty:
+                return {
+                    'status': 'success',
+                    'output': '',
+                    'errors': '',
+                    'cached': True
+                }
+                
+            if check is not None and not self.use_cli:
+                return await self._run_in_process(tool, check, dirty)
+                
+            # Shard largest-first, round-robin, so the biggest files start
+            # first and land on different processes; use more shards than
+            # cores when one per core would overflow the command line
+            dirty.sort(key=lambda path: path.stat().st_size, reverse=True)
+            workers = min(os.cpu_count() or 1, len(dirty))
+            workers = max(workers, -(-len(dirty) // _MAX_FILE_ARGS))
+            shards = [dirty[i::workers] for i in range(workers)]
+            results = await asyncio.gather(*(self._run_shard(tool, args, shard, parse) for shard in shards))
+            
+            failed = any(returncode != 0 for returncode, _, _, _ in results)
+            result = {
+                'status': 'failed' if failed else 'success',
+                'output': ''.join(stdout for _, stdout, _, _ in results),
+                'errors': ''.join(stderr for _, _, stderr, _ in results)
             }
+            if parse is not None:
+                result['issues'] = [issue for _, _, _, issues in results for issue in issues]
+            return result
         except Exception as e:
             return {
                 'status': 'error',
                 'error': str(e)
             }
 
-    def _run_isort(self) -> Dict:
-        """Run isort formatter."""
-        try:
-            result = subprocess.run(
-                ['isort', str(self.project_root), '--check-only'],
-                capture_output=True,
-                text=True
+    async def _run_shard(self, tool: str, args: List[str], files: List[Path],
+                         parse: Optional[Callable[[str], Optional[Dict]]] = None) -> tuple:
+        """Run one formatter process over a shard of files.
+        
+        Returns:
+            (returncode, stdout, stderr, issues); stdout is empty when parse
+            is given, its lines having been turned into issues instead
+        """
+        issues = []
+        async with self._proc_slots:
+            proc = await asyncio.create_subprocess_exec(
+                tool,
+                *args,
+                '--',
+                *map(str, files),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
             )
-            return {
-                'status': 'success' if result.returncode == 0 else 'failed',
-                'output': result.stdout,
-                'errors': result.stderr
-            }
-        except Exception as e:
-            return {
-                'status': 'error',
-                'error': str(e)
-            }
+            if parse is None:
+                stdout, stderr = await proc.communicate()
+            else:
+                # Drain stderr alongside so a full pipe can't stall the tool
+                stderr_read = asyncio.ensure_future(proc.stderr.read())
+                async for line in proc.stdout:
+                    issue = parse(line.decode('utf-8', 'replace').rstrip('\n'))
+                    if issue:
+                        issues.append(issue)
+                stdout, stderr = b'', await stderr_read
+                await proc.wait()
+                
+        if proc.returncode == 0:
+            # In-place tools may have rewritten files, so hash afterwards
+            self._mark_clean(tool, files)
+        return proc.returncode, stdout.decode('utf-8', 'replace'), stderr.decode('utf-8', 'replace'), issues
 
-    def _run_flake8(self) -> Dict:
-        """Run flake8 linter."""
+    async def _run_in_process(self, tool: str, check: Callable[[Path], Optional[str]],
+                              files: List[Path]) -> Dict:
+        """Run an in-process formatter over files in a worker thread."""
+        def run():
+            messages, clean = [], []
+            for path in files:
+                try:
+                    message = check(path)
+                except Exception as e:
+                    message = f"error: cannot format {path}: {e}"
+                if message:
+                    messages.append(message)
+                else:
+                    clean.append(path)
+            return messages, clean
+            
+        messages, clean = await asyncio.get_running_loop().run_in_executor(None, run)
+        # Cache writes stay on the event loop thread
+        self._mark_clean(tool, clean)
+        return {
+            'status': 'failed' if messages else 'success',
+            'output': '',
+            'errors': ''.join(f"{message}\n" for message in messages)
+        }
+
+    @cached_property
+    def _black_mode(self) -> "black.Mode":
+        """Black mode from the project's [tool.black] settings, as the CLI reads them."""
+        pyproject = black.find_pyproject_toml((str(self.project_root),))
+        config = black.parse_pyproject_toml(pyproject) if pyproject else {}
+        return black.Mode(
+            target_versions={black.TargetVersion[v.upper()] for v in config.get('target_version', [])},
+            line_length=config.get('line_length', black.DEFAULT_LINE_LENGTH),
+            string_normalization=not config.get('skip_string_normalization', False),
+            magic_trailing_comma=not config.get('skip_magic_trailing_comma', False),
+            preview=config.get('preview', False)
+        )
+
+    @cached_property
+    def _isort_config(self) -> "isort.Config":
+        """isort settings found from the project root, as the CLI finds them."""
+        return isort.Config(settings_path=str(self.project_root))
+
+    def _check_black(self, path: Path) -> Optional[str]:
+        """Black --check for one file."""
         try:
-            result = subprocess.run(
-                ['flake8', str(self.project_root), '--max-line-length=88'],
-                capture_output=True,
-                text=True
-            )
-            return {
-                'status': 'success' if result.returncode == 0 else 'failed',
-                'output': result.stdout,
-                'errors': result.stderr
-            }
-        except Exception as e:
-            return {
-                'status': 'error',
-                'error': str(e)
-            }
+            black.format_file_contents(path.read_text(), fast=False, mode=self._black_mode)
+        except black.NothingChanged:
+            return None
+        return f"would reformat {path}"
+
+    def _check_isort(self, path: Path) -> Optional[str]:
+        """isort --check-only for one file."""
+        if isort.check_code(path.read_text(), config=self._isort_config, file_path=path):
+            return None
+        return f"ERROR: {path} Imports are incorrectly sorted and/or formatted."
+
+    @staticmethod
+    def _fix_autopep8(path: Path) -> None:
+        """autopep8 --in-place --aggressive for one file."""
+        source = path.read_text()
+        fixed = autopep8.fix_code(source, options={'aggressive': 1})
+        if fixed != source:
+            path.write_text(fixed)
 
-    def _run_autopep8(self) -> Dict:
+    @staticmethod
+    def _fix_yapf(path: Path) -> None:
+        """yapf --in-place --style=pep8 for one file."""
+        formatted, changed = yapf_api.FormatCode(path.read_text(), style_config='pep8')
+        if changed:
+            path.write_text(formatted)
+
+    async def _run_black(self) -> Dict:
+        """Run Black formatter."""
+        return await self._run_tool('black', ['--check'], self._check_black if black else None)
+
+    async def _run_isort(self) -> Dict:
+        """Run isort formatter."""
+        return await self._run_tool('isort', ['--check-only'], self._check_isort if isort else None)
+
+    async def _run_flake8(self) -> Dict:
+        """Run flake8 linter."""
+        # flake8 has no stable in-process API that returns its report text
+        return await self._run_tool('flake8', ['--max-line-length=88'], parse=_parse_flake8_line)
+
+    async def _run_autopep8(self) -> Dict:
         """Run autopep8 formatter."""
-        try:
-            result = subprocess.run(
-                ['autopep8', str(self.project_root), '--in-place', '--aggressive'],
-                capture_output=True,
-                text=True
-            )
-            return {
-                'status': 'success' if result.returncode == 0 else 'failed',
-                'output': result.stdout,
-                'errors': result.stderr
-            }
-        except Exception as e:
-            return {
-                'status': 'error',
-                'error': str(e)
-            }
+        return await self._run_tool(
+            'autopep8',
+            ['--in-place', '--aggressive'],
+            self._fix_autopep8 if autopep8 else None
+        )
 
-    def _run_yapf(self) -> Dict:
+    async def _run_yapf(self) -> Dict:
         """Run yapf formatter."""
-        try:
-            result = subprocess.run(
-                ['yapf', str(self.project_root), '--in-place', '--style=pep8'],
-                capture_output=True,
-                text=True
-            )
-            return {
-                'status': 'success' if result.returncode == 0 else 'failed',
-                'output': result.stdout,
-                'errors': result.stderr
-            }
-        except Exception as e:
-            return {
-                'status': 'error',
-                'error': str(e)
-            }
+        return await self._run_tool(
+            'yapf',
+            ['--in-place', '--style=pep8'],
+            self._fix_yapf if yapf_api else None
+        )
 
     def generate_report(self, output_file: str = 'formatting_report.md') -> None:
         """Generate formatting report."""
-        report = "# Code Formatting Report\n\n"
+        parts = ["# Code Formatting Report\n\n"]
         
         for formatter, result in self.results.items():
-            report += f"## {formatter.capitalize()}\n\n"
-            report += f"Status: {result['status']}\n\n"
+            parts.append(f"## {formatter.capitalize()}\n\n")
+            parts.append(f"Status: {result['status']}\n\n")
             
             if result['status'] == 'success':
-                report += "### Results\n\n"
-                report += f"```
-{result['output']}
-```
-\n"
+                parts.append("### Results\n\n")
+                parts.append(f"```\n{result['output']}\n```\n\n")
             elif result['status'] == 'failed':
-                report += "### Errors\n\n"
-                report += f"```
-{result['errors']}
-```
-\n"
+                parts.append("### Errors\n\n")
+                parts.append(f"```\n{result['errors']}\n```\n\n")
             else:
-                report += "### Error\n\n"
-                report += f"```
-{result['error']}
-```
-\n"
+                parts.append("### Error\n\n")
+                parts.append(f"```\n{result['error']}\n```\n\n")
 
-        with open(output_file, 'w') as f:
-            f.write(report)
+        Path(output_file).write_bytes(''.join(parts).encode('utf-8'))
 
     def get_issues(self) -> List[Dict]:
         """Get formatting issues from all formatters."""
@@ -170,31 +549,23 @@ class CodeFormatter:
             if result['status'] == 'failed':
                 # Parse issues based on formatter format
                 if formatter == 'flake8':
-                    # Parse flake8 output
-                    lines = result['output'].split('\n')
-                    for line in lines:
-                        if line:
-                            parts = line.split(':')
-                            if len(parts) >= 4:
-                                issues.append({
-                                    'formatter': formatter,
-                                    'file': parts[0],
-                                    'line': parts[1],
-                                    'column': parts[2],
-                                    'message': parts[3]
-                                })
+                    # Parsed while flake8 ran
+                    issues.extend(result.get('issues', []))
                 elif formatter == 'black':
-                    # Parse Black output
-                    if result['output']:
-                        issues.append({
+                    # Black reports files it would reformat on stderr
+                    issues.extend(
+                        {
                             'formatter': formatter,
-                            'message': result['output']
-                        })
+                            'file': match[1],
+                            'message': 'would reformat'
+                        }
+                        for match in _BLACK_RE.finditer(result['errors'])
+                    )
 
         return issues
 
 if __name__ == "__main__":
     formatter = CodeFormatter()
-    results = formatter.format_code()
+    results = formatter.format_code_sync()
     formatter.generate_report()
     issues = formatter.get_issues()
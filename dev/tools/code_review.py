@@ -1,8 +1,11 @@
+import ast
+import copy
+import functools
 import logging
 import asyncio
-import aiohttp
-from typing import Dict, List, Optional
-import yaml
+import os
+import re
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 import json
 from datetime import datetime
 
@@ -12,15 +15,86 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# aiohttp and yaml are imported on first use, keeping module import cheap
+# for hooks that only analyze code
+if TYPE_CHECKING:
+    import aiohttp
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml(path: str, mtime_ns: int) -> dict:
+    """Parse a YAML file once per (path, mtime) within this process."""
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=loader)
+
+# Lines counted as branches by the complexity metric
+_BRANCH_RE = re.compile(r'\b(?:if|else|for)\b')
+
+# AST nodes counted as branches by the complexity metric
+_BRANCH_NODES = (ast.If, ast.For, ast.While, ast.Try, ast.BoolOp, ast.ExceptHandler, ast.comprehension)
+
+def _any_of(words: List[str], flags: int = 0) -> Optional[re.Pattern]:
+    """Compile a regex matching any of the given literal strings."""
+    if not words:
+        return None
+    return re.compile('|'.join(map(re.escape, words)), flags)
+
 class CodeReview:
+    # Reviews posted at once by review_prs
+    MAX_CONCURRENT_REVIEWS = 20
+
     def __init__(self, config_file: str = "code_review_config.yaml"):
         self.config = self._load_config(config_file)
-        self.session = aiohttp.ClientSession()
+        security_rules = self.config.get('security_rules', {})
+        self._secrets_re = _any_of(security_rules.get('secrets', []), re.IGNORECASE)
+        self._unsafe_re = _any_of(security_rules.get('unsafe_operations', []))
+        perf_rules = self.config.get('performance_rules', {})
+        self._large_ds_re = _any_of(perf_rules.get('large_data_structures', []))
+        style_rules = self.config.get('style_rules', {})
+        self._max_line_length = style_rules.get('max_line_length', 88)
+        self._max_imports = style_rules.get('max_imports', 20)
+        self._line_length_message = f'Line exceeds {self._max_line_length} characters'
+        self._session = None
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """HTTP session, created on first use inside the running loop.
+
+        Reused across reviews so each post after the first rides an open
+        keep-alive connection instead of a fresh TCP and TLS handshake.
+        """
+        if self._session is None:
+            import aiohttp
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300
+                ),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._session
+
+    async def __aenter__(self) -> "CodeReview":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP session if one was opened."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     def _load_config(self, config_file: str) -> Dict:
         """Load code review configuration."""
-        with open(config_file) as f:
-            return yaml.safe_load(f)
+        # Copy so callers can't mutate the cached parse
+        return copy.deepcopy(_load_yaml(config_file, os.stat(config_file).st_mtime_ns))
 
     async def analyze_code(self, code: str, filename: str) -> Dict:
         """Analyze code for review criteria."""
@@ -30,8 +104,11 @@ class CodeReview:
             'suggestions': []
         }
 
+        lines = code.split('\n')
+        tree = self._parse(code, filename)
+        
         # Check code style
-        style_issues = self._check_code_style(code, filename)
+        style_issues = self._check_code_style(lines, filename, tree)
         results['issues'].extend(style_issues)
 
         # Check security
@@ -43,33 +120,51 @@ class CodeReview:
         results['issues'].extend(performance_issues)
 
         # Calculate metrics
-        results['metrics'] = self._calculate_metrics(code)
+        results['metrics'] = self._calculate_metrics(lines, tree)
 
         # Generate suggestions
         results['suggestions'] = self._generate_suggestions(results['issues'])
 
         return results
 
-    def _check_code_style(self, code: str, filename: str) -> List[Dict]:
-        """Check code style against configured rules."""
-        issues = []
-        style_rules = self.config.get('style_rules', {})
+    def _parse(self, code: str, filename: str) -> Optional[ast.Module]:
+        """Parse Python source once for the AST-based checks.
+        
+        Returns:
+            The module AST, or None for non-Python files and code that
+            doesn't parse, in which case the checks fall back to line scans
+        """
+        if not filename.endswith('.py'):
+            return None
+        try:
+            return ast.parse(code, filename)
+        except (SyntaxError, ValueError):
+            return None
 
+    def _check_code_style(self, lines: List[str], filename: str,
+                          tree: Optional[ast.Module] = None) -> List[Dict]:
+        """Check code style against configured rules."""
         # Check line length
-        max_line_length = style_rules.get('max_line_length', 88)
-        for i, line in enumerate(code.split('\n')):
-            if len(line) > max_line_length:
-                issues.append({
-                    'type': 'style',
-                    'rule': 'line_length',
-                    'line': i + 1,
-                    'message': f'Line exceeds {max_line_length} characters'
-                })
+        max_line_length = self._max_line_length
+        message = self._line_length_message
+        issues = [
+            {
+                'type': 'style',
+                'rule': 'line_length',
+                'line': i,
+                'message': message
+            }
+            for i, line in enumerate(lines, 1)
+            if len(line) > max_line_length
+        ]
 
         # Check imports
         if filename.endswith('.py'):
-            import_lines = [line for line in code.split('\n') if line.startswith('import') or line.startswith('from')]
-            if len(import_lines) > style_rules.get('max_imports', 20):
+            if tree is not None:
+                import_count = sum(1 for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom)))
+            else:
+                import_count = sum(1 for line in lines if line.startswith(('import', 'from')))
+            if import_count > self._max_imports:
                 issues.append({
                     'type': 'style',
                     'rule': 'imports',
@@ -81,10 +176,9 @@ class CodeReview:
     async def _check_security(self, code: str, filename: str) -> List[Dict]:
         """Check code for security issues."""
         issues = []
-        security_rules = self.config.get('security_rules', {})
 
         # Check for hardcoded secrets
-        if any(secret in code.lower() for secret in security_rules.get('secrets', [])):
+        if self._secrets_re and self._secrets_re.search(code):
             issues.append({
                 'type': 'security',
                 'rule': 'hardcoded_secret',
@@ -92,7 +186,7 @@ class CodeReview:
             })
 
         # Check for unsafe operations
-        if any(op in code for op in security_rules.get('unsafe_operations', [])):
+        if self._unsafe_re and self._unsafe_re.search(code):
             issues.append({
                 'type': 'security',
                 'rule': 'unsafe_operation',
@@ -115,7 +209,7 @@ class CodeReview:
             })
 
         # Check for large data structures
-        if any(ds in code for ds in perf_rules.get('large_data_structures', [])):
+        if self._large_ds_re and self._large_ds_re.search(code):
             issues.append({
                 'type': 'performance',
                 'rule': 'large_data_structure',
@@ -124,25 +218,27 @@ class CodeReview:
 
         return issues
 
-    def _calculate_metrics(self, code: str) -> Dict:
+    def _calculate_metrics(self, lines: List[str], tree: Optional[ast.Module] = None) -> Dict:
         """Calculate code metrics."""
         metrics = {
-            'lines_of_code': len(code.split('\n')),
-            'complexity': self._calculate_complexity(code),
-            'maintainability': self._calculate_maintainability(code)
+            'lines_of_code': len(lines),
+            'complexity': self._calculate_complexity(lines, tree),
+            'maintainability': self._calculate_maintainability(lines)
         }
         return metrics
 
-    def _calculate_complexity(self, code: str) -> int:
+    def _calculate_complexity(self, lines: List[str], tree: Optional[ast.Module] = None) -> int:
         """Calculate code complexity."""
         # Simple complexity calculation based on number of branches
-        return len([line for line in code.split('\n') if 'if' in line or 'else' in line or 'for' in line])
+        if tree is not None:
+            return sum(1 for node in ast.walk(tree) if isinstance(node, _BRANCH_NODES))
+        return sum(1 for line in lines if _BRANCH_RE.search(line))
 
-    def _calculate_maintainability(self, code: str) -> float:
+    def _calculate_maintainability(self, lines: List[str]) -> float:
         """Calculate maintainability index."""
         # Simple maintainability calculation
-        loc = len(code.split('\n'))
-        comments = len([line for line in code.split('\n') if line.strip().startswith('#')])
+        loc = len(lines)
+        comments = sum(1 for line in lines if line.lstrip().startswith('#'))
         return (comments / loc) * 100 if loc > 0 else 0
 
     def _generate_suggestions(self, issues: List[Dict]) -> List[Dict]:
@@ -211,26 +307,26 @@ class CodeReview:
 
     def _format_review_message(self, review_data: Dict) -> str:
         """Format review message for display."""
-        message = "# Code Review Results\n\n"
+        parts = ["# Code Review Results\n\n"]
         
         # Add metrics
-        message += "## Metrics\n\n"
-        for metric, value in review_data['metrics'].items():
-            message += f"- {metric}: {value}\n"
+        parts.append("## Metrics\n\n")
+        parts.extend(f"- {metric}: {value}\n" for metric, value in review_data['metrics'].items())
         
         # Add issues
         if review_data['issues']:
-            message += "\n## Issues Found\n\n"
-            for issue in review_data['issues']:
-                message += f"- **{issue['type']}**: {issue['message']}\n"
+            parts.append("\n## Issues Found\n\n")
+            parts.extend(f"- **{issue['type']}**: {issue['message']}\n" for issue in review_data['issues'])
         
         # Add suggestions
         if review_data['suggestions']:
-            message += "\n## Suggestions\n\n"
-            for suggestion in review_data['suggestions']:
-                message += f"- **{suggestion['rule']}**: {suggestion['message']}\n"
+            parts.append("\n## Suggestions\n\n")
+            parts.extend(
+                f"- **{suggestion['rule']}**: {suggestion['message']}\n"
+                for suggestion in review_data['suggestions']
+            )
         
-        return message
+        return ''.join(parts)
 
     async def review_pr(self, pr_id: str, code: str, filename: str) -> Dict:
         """Review a pull request."""
@@ -248,13 +344,37 @@ class CodeReview:
                 'message': str(e)
             }
 
+    async def review_prs(self, pr_items: List[Tuple[str, str, str]]) -> List[Dict]:
+        """Review several pull requests concurrently.
+        
+        Args:
+            pr_items: (pr_id, code, filename) tuples
+            
+        Returns:
+            One review_pr result per item, in the same order
+        """
+        # Stay under the platforms' secondary rate limits on concurrent writes
+        slots = asyncio.Semaphore(self.MAX_CONCURRENT_REVIEWS)
+        
+        async def review(pr_id: str, code: str, filename: str) -> Dict:
+            async with slots:
+                return await self.review_pr(pr_id, code, filename)
+                
+        results = await asyncio.gather(
+            *(review(*item) for item in pr_items),
+            return_exceptions=True
+        )
+        return [
+            {'status': 'error', 'message': str(result)} if isinstance(result, BaseException) else result
+            for result in results
+        ]
+
 if __name__ == "__main__":
     # Example usage
     async def main():
-        reviewer = CodeReview()
-        
-        # Example code to review
-        code = """
+        async with CodeReview() as reviewer:
+            # Example code to review
+            code = """
 def process_data(data):
     if len(data) > 1000:
         for item in data:
@@ -263,9 +383,9 @@ def process_data(data):
             else:
                 print(-item)
 """
-        
-        # Review a PR
-        result = await reviewer.review_pr('123', code, 'example.py')
-        print(json.dumps(result, indent=2))
+            
+            # Review a PR
+            result = await reviewer.review_pr('123', code, 'example.py')
+            print(json.dumps(result, indent=2))
 
     asyncio.run(main())
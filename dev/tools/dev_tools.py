@@ -2,7 +2,19 @@ import os
 import subprocess
 import json
 from pathlib import Path
+from typing import List, Tuple
 import logging
+import yaml
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 # Set up logging
 logging.basicConfig(
@@ -11,6 +23,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Kept local rather than importing core.json_io: this file runs as a plain
+# script (python dev/tools/dev_tools.py), where core isn't importable
+def _dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file via a temp file and rename, so readers never see it half-written."""
+    temp_path = path.with_name(path.name + '.tmp')
+    temp_path.write_bytes(data)
+    os.replace(temp_path, path)
+
 class DevTools:
     def __init__(self, project_root: str = os.getcwd()):
         self.project_root = Path(project_root)
@@ -22,13 +48,20 @@ class DevTools:
         if not config_path.exists():
             raise FileNotFoundError(f"Config file not found: {config_path}")
             
-        with open(config_path) as f:
-            return json.load(f)
+        # The file is a multi-document manifest; the dev settings are the
+        # leading ConfigMap, so stop parsing after the first document
+        with open(config_path, 'rb') as f:
+            return next(yaml.load_all(f, Loader=_YamlLoader), None) or {}
 
-    def setup_ide(self) -> None:
-        """Set up IDE configuration."""
-        logger.info("Setting up IDE configuration...")
-        
+    def _write_payloads(self, payloads: List[Tuple[Path, bytes]]) -> None:
+        """Write generated files, creating each parent directory once."""
+        for parent in {path.parent for path, _ in payloads}:
+            os.makedirs(parent, exist_ok=True)
+        for path, data in payloads:
+            _write_atomic(path, data)
+
+    def _ide_payload(self) -> Tuple[Path, bytes]:
+        """VS Code settings file and contents."""
         # Create VS Code settings
         settings_path = self.project_root / ".vscode" / "settings.json"
         settings = {
@@ -40,17 +73,16 @@ class DevTools:
                 "source.organizeImports": True
             }
         }
-        
-        os.makedirs(settings_path.parent, exist_ok=True)
-        with open(settings_path, 'w') as f:
-            json.dump(settings, f, indent=2)
-        
+        return settings_path, _dumps(settings)
+
+    def setup_ide(self) -> None:
+        """Set up IDE configuration."""
+        logger.info("Setting up IDE configuration...")
+        self._write_payloads([self._ide_payload()])
         logger.info("IDE configuration complete")
 
-    def setup_linting(self) -> None:
-        """Set up linting tools."""
-        logger.info("Setting up linting tools...")
-        
+    def _linting_payload(self) -> Tuple[Path, bytes]:
+        """Linting configuration file and contents."""
         # Create pyproject.toml
         pyproject_path = self.project_root / "pyproject.toml"
         pyproject = {
@@ -69,16 +101,16 @@ class DevTools:
                 }
             }
         }
-        
-        with open(pyproject_path, 'w') as f:
-            json.dump(pyproject, f, indent=2)
-        
+        return pyproject_path, _dumps(pyproject)
+
+    def setup_linting(self) -> None:
+        """Set up linting tools."""
+        logger.info("Setting up linting tools...")
+        self._write_payloads([self._linting_payload()])
         logger.info("Linting configuration complete")
 
-    def setup_debugging(self) -> None:
-        """Set up debugging tools."""
-        logger.info("Setting up debugging tools...")
-        
+    def _debugging_payload(self) -> Tuple[Path, bytes]:
+        """VS Code launch configuration file and contents."""
         # Create launch configuration
         launch_path = self.project_root / ".vscode" / "launch.json"
         launch_config = {
@@ -107,17 +139,16 @@ class DevTools:
                 }
             ]
         }
-        
-        os.makedirs(launch_path.parent, exist_ok=True)
-        with open(launch_path, 'w') as f:
-            json.dump(launch_config, f, indent=2)
-        
+        return launch_path, _dumps(launch_config)
+
+    def setup_debugging(self) -> None:
+        """Set up debugging tools."""
+        logger.info("Setting up debugging tools...")
+        self._write_payloads([self._debugging_payload()])
         logger.info("Debugging configuration complete")
 
-    def setup_version_control(self) -> None:
-        """Set up version control configuration."""
-        logger.info("Setting up version control...")
-        
+    def _version_control_payload(self) -> Tuple[Path, bytes]:
+        """.gitignore file and contents."""
         # Create gitignore
         gitignore_path = self.project_root / ".gitignore"
         gitignore_content = """
@@ -171,19 +202,26 @@ class DevTools:
         # Development
         .dev/
         """
-        
-        with open(gitignore_path, 'w') as f:
-            f.write(gitignore_content)
-        
+        return gitignore_path, gitignore_content.encode('utf-8')
+
+    def setup_version_control(self) -> None:
+        """Set up version control configuration."""
+        logger.info("Setting up version control...")
+        self._write_payloads([self._version_control_payload()])
         logger.info("Version control configuration complete")
 
     def setup_all(self) -> None:
         """Set up all development tools."""
         logger.info("Setting up all development tools...")
-        self.setup_ide()
-        self.setup_linting()
-        self.setup_debugging()
-        self.setup_version_control()
+        self._write_payloads([
+            self._ide_payload(),
+            self._linting_payload(),
+            self._debugging_payload(),
+            self._version_control_payload()
+        ])
+        # One flush to disk for the whole batch rather than an fsync per file
+        if hasattr(os, 'sync'):
+            os.sync()
         logger.info("All development tools setup complete")
 
 if __name__ == "__main__":
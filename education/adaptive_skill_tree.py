@@ -1,7 +1,12 @@
+import hashlib
+import json
 import networkx as nx
 from sklearn.cluster import OPTICS
+from sklearn.metrics import davies_bouldin_score
+from sklearn.neighbors import NearestNeighbors
 from typing import Dict, List, Tuple, Any
 import numpy as np
+from qiskit import QuantumCircuit
 from quantum_nexus.quantum_healing import QuantumHealingCore
 from quantum_nexus.quantum_teleportation import QuantumTeleportation
 from neurosymbolic.hdc_reasoning import QuantumHDReasoner
@@ -9,8 +14,28 @@ from governance.agent_guardrails import EthicalConstraintEngine
 from quantum_nexus.qa_solver import QuantumAnnealer
 
 class QuantumAdaptiveSkillTree:
-    def __init__(self, user_profile: Dict[str, Any]):
-        """Initialize quantum-enhanced adaptive skill tree."""
+    # Default neighborhood radius for clustering; OPTICS ignores pairs
+    # farther apart. Bounding it keeps the neighbor graph sparse; raise it
+    # (up to inf, OPTICS' own default) if related competencies end up as noise
+    NEIGHBOR_RADIUS = 0.5
+    
+    # Most min_samples values tried when tuning the clustering
+    MIN_SAMPLES_TRIALS = 20
+    
+    def __init__(self, user_profile: Dict[str, Any], use_annealing: bool = False,
+                 neighbor_radius: float = NEIGHBOR_RADIUS):
+        """Initialize quantum-enhanced adaptive skill tree.
+        
+        Args:
+            user_profile: Learner profile
+            use_annealing: Pick prerequisite edges with the quantum annealer
+                instead of chaining competencies by difficulty
+            neighbor_radius: Largest state distance OPTICS considers (its
+                max_eps); pass float("inf") for an unbounded, all-pairs search
+        """
+        self.use_annealing = use_annealing
+        self.neighbor_radius = neighbor_radius
+        
         # Initialize quantum components
         self.quantum_healer = QuantumHealingCore()
         self.quantum_teleporter = QuantumTeleportation()
@@ -25,25 +50,27 @@ class QuantumAdaptiveSkillTree:
         self.prerequisites = {}
         self.difficulty_levels = {}
         
+        # (state digest, sparse radius-neighbors graph) of the last clustering
+        self._neighbor_graph = None
+        
+        # Bumped on every graph change; keys the cached learning path
+        self._graph_version = 0
+        self._path_cache_key = None
+        self._path_cache = []
+        
     def _quantum_cluster_competencies(self, competencies: List[Dict[str, Any]]) -> Dict[int, List[str]]:
         """Quantum-enhanced competency clustering."""
         try:
-            # Convert competencies to quantum states
-            quantum_states = []
-            for comp in competencies:
-                state = self.quantum_teleporter.prepare_message(
-                    json.dumps(comp)
-                )
-                quantum_states.append(state)
-                
+            # Convert competencies to quantum states in one batch
+            payloads = [json.dumps(comp, separators=(",", ":")) for comp in competencies]
+            quantum_states = self.quantum_teleporter.prepare_messages(payloads)
+            
             # Apply quantum healing
-            healed_states = []
-            for state in quantum_states:
-                healed = self.quantum_healer.heal_state(state)
-                healed_states.append(healed)
+            healed_states = np.asarray(self.quantum_healer.heal_states(quantum_states))
                 
-            # Cluster using quantum-enhanced OPTICS
-            clustering = OPTICS(min_samples=3).fit(healed_states)
+            # Cluster using quantum-enhanced OPTICS on a sparse neighbor graph
+            graph = self._radius_graph(healed_states)
+            clustering = self._fit_optics(graph, healed_states)
             
             # Group competencies by cluster
             clusters = {}
@@ -71,27 +98,89 @@ class QuantumAdaptiveSkillTree:
                 "error": str(e)
             }
             
+    def _radius_graph(self, states: np.ndarray):
+        """Sparse distance graph of states within neighbor_radius of each other.
+        
+        Built once per distinct set of healed states and reused, so OPTICS
+        works from O(N*k) stored neighbors instead of all-pairs distances.
+        The cache is keyed on the states themselves (and the radius), since
+        healing can map the same competencies to different states.
+        """
+        states = np.ascontiguousarray(states)
+        hasher = hashlib.blake2b(states.tobytes(), digest_size=16)
+        hasher.update(repr((states.shape, states.dtype.str, self.neighbor_radius)).encode("utf-8"))
+        digest = hasher.hexdigest()
+        if self._neighbor_graph is None or self._neighbor_graph[0] != digest:
+            graph = NearestNeighbors(radius=self.neighbor_radius).fit(states).radius_neighbors_graph(
+                states,
+                mode="distance"
+            )
+            self._neighbor_graph = (digest, graph)
+        return self._neighbor_graph[1]
+        
+    def _fit_optics(self, graph, states: np.ndarray) -> OPTICS:
+        """Fit OPTICS with the min_samples that best separates the clusters.
+        
+        Tries min_samples from 2 to sqrt(N) and keeps the fit with the lowest
+        Davies-Bouldin score over non-noise points. Falls back to
+        min_samples=3 when no candidate yields at least two clusters.
+        """
+        upper = max(3, int(len(states) ** 0.5))
+        candidates = np.unique(
+            np.linspace(2, upper, num=min(self.MIN_SAMPLES_TRIALS, upper - 1)).astype(int)
+        )
+        
+        best, best_score = None, np.inf
+        for min_samples in candidates:
+            if min_samples > len(states):
+                break
+            clustering = OPTICS(
+                min_samples=int(min_samples),
+                max_eps=self.neighbor_radius,
+                metric="precomputed"
+            ).fit(graph)
+            
+            clustered = clustering.labels_ >= 0
+            if len(np.unique(clustering.labels_[clustered])) < 2:
+                continue
+            score = davies_bouldin_score(states[clustered], clustering.labels_[clustered])
+            if score < best_score:
+                best, best_score = clustering, score
+                
+        if best is None:
+            best = OPTICS(
+                min_samples=3,
+                max_eps=self.neighbor_radius,
+                metric="precomputed"
+            ).fit(graph)
+        return best
+        
     def _quantum_anneal_edges(self, clusters: Dict[int, List[str]]) -> None:
-        """Quantum annealing for prerequisite optimization."""
+        """Prerequisite optimization within each cluster.
+        
+        By default each cluster becomes a chain from its easiest to its
+        hardest competency; the quantum annealing formulation is kept behind
+        use_annealing.
+        """
         try:
-            # Create quantum annealing problem
-            Q = {}  # Quadratic coefficients
-            
-            # Add quantum constraints
-            for cluster_id, competencies in clusters.items():
-                for comp1 in competencies:
-                    for comp2 in competencies:
-                        if comp1 != comp2:
-                            # Quantum coupling term
-                            Q[(comp1, comp2)] = -1.0
-                            
-            # Solve using quantum annealing
-            solution = self.qa_solver.solve(Q)
-            
-            # Add edges to graph
-            for comp1, comp2 in solution:
-                if solution[(comp1, comp2)] > 0:
-                    self.graph.add_edge(comp1, comp2)
+            if self.use_annealing:
+                # Create quantum annealing problem: one dense coupling block per
+                # cluster, -1.0 between every pair of distinct competencies
+                blocks = {
+                    cluster_id: (competencies, np.eye(len(competencies)) - 1.0)
+                    for cluster_id, competencies in clusters.items()
+                }
+                                
+                # Solve using quantum annealing
+                solution = self.qa_solver.solve(self._qubo_from_blocks(blocks))
+                
+                # Add edges to graph
+                for comp1, comp2 in solution:
+                    if solution[(comp1, comp2)] > 0:
+                        self._add_edges([(comp1, comp2)])
+            else:
+                for competencies in clusters.values():
+                    self._add_edges(self._chain_prerequisites(competencies))
                     
             # Store prerequisites
             self.prerequisites = {
@@ -102,6 +191,8 @@ class QuantumAdaptiveSkillTree:
             # Generate explanation
             explanation = self.reasoner.explain_reasoning(
                 "Prerequisite relationships using quantum annealing"
+                if self.use_annealing else
+                "Prerequisite relationships using difficulty-ordered chains"
             )
             
             return {
@@ -115,32 +206,71 @@ class QuantumAdaptiveSkillTree:
                 "error": str(e)
             }
             
+    def _add_node(self, node: str, **attrs) -> None:
+        """Add a node to the skill graph, invalidating the cached learning path."""
+        self.graph.add_node(node, **attrs)
+        self._graph_version += 1
+        
+    def _add_edges(self, edges: List[Tuple[str, str]]) -> None:
+        """Add edges to the skill graph, invalidating the cached learning path."""
+        self.graph.add_edges_from(edges)
+        self._graph_version += 1
+        
+    def _chain_prerequisites(self, competencies: List[str]) -> List[Tuple[str, str]]:
+        """Chain competencies from easiest to hardest.
+        
+        Competencies are sorted by difficulty (ties keep their order) and
+        each one becomes the prerequisite of the next, so the edges form a
+        single path and never a cycle.
+        """
+        ordered = sorted(competencies, key=lambda comp: self.difficulty_levels.get(comp, 0.5))
+        return list(zip(ordered[:-1], ordered[1:]))
+        
+    @staticmethod
+    def _qubo_from_blocks(blocks: Dict[int, Tuple[List[str], np.ndarray]]) -> Dict[Tuple[str, str], float]:
+        """Flatten per-cluster coupling matrices into the solver's QUBO dict."""
+        Q = {}  # Quadratic coefficients
+        for competencies, coupling in blocks.values():
+            names = np.asarray(competencies, dtype=object)
+            rows, cols = np.nonzero(coupling)
+            Q.update(zip(zip(names[rows], names[cols]), coupling[rows, cols].tolist()))
+        return Q
+        
     def _quantum_calculate_difficulty(self, competencies: List[Dict[str, Any]]) -> Dict[str, float]:
         """Quantum-enhanced difficulty calculation."""
         try:
             # Create quantum circuit for difficulty estimation
-            qc = QuantumCircuit(2)
+            base = QuantumCircuit(2)
             
             # Add quantum gates
-            qc.h(0)
-            qc.cx(0, 1)
-            qc.h(0)
+            base.h(0)
+            base.cx(0, 1)
+            base.h(0)
             
             # Apply quantum healing
-            for comp in competencies:
-                state = self.quantum_teleporter.prepare_message(
-                    json.dumps(comp)
-                )
-                healed = self.quantum_healer.heal_state(state)
-                
-                # Calculate difficulty
+            payloads = [json.dumps(comp, separators=(",", ":")) for comp in competencies]
+            healed_batch = self.quantum_healer.heal_states(
+                self.quantum_teleporter.prepare_messages(payloads)
+            )
+            
+            # One circuit per competency, all run as a single backend job
+            circuits = []
+            for healed in healed_batch:
+                qc = base.copy()
                 qc.initialize(healed, 0)
-                result = self.quantum_healer.backend.run(qc, shots=1000).result()
-                counts = result.get_counts()
-                
-                # Store difficulty
-                difficulty = max(counts.values()) / sum(counts.values())
-                self.difficulty_levels[comp["name"]] = difficulty
+                circuits.append(qc)
+            result = self.quantum_healer.backend.run(circuits, shots=1000).result()
+            
+            # Calculate and store difficulties
+            counts_list = [result.get_counts(i) for i in range(len(circuits))]
+            difficulties = np.fromiter(
+                (max(counts.values()) / sum(counts.values()) for counts in counts_list),
+                dtype=float,
+                count=len(counts_list)
+            )
+            self.difficulty_levels.update(
+                zip((comp["name"] for comp in competencies), difficulties.tolist())
+            )
                 
             # Generate explanation
             explanation = self.reasoner.explain_reasoning(
@@ -227,7 +357,7 @@ class QuantumAdaptiveSkillTree:
             # Add nodes to graph
             for cluster_id, comps in clusters["clusters"].items():
                 for comp in comps:
-                    self.graph.add_node(
+                    self._add_node(
                         comp,
                         difficulty=self.difficulty_levels.get(comp, 0.5)
                     )
@@ -256,11 +386,19 @@ class QuantumAdaptiveSkillTree:
             }
             
     def _generate_learning_path(self) -> List[str]:
-        """Generate personalized learning path."""
+        """Generate personalized learning path.
+        
+        The path is cached until the graph or the user's level changes, so
+        generate_tree and its validation share one traversal.
+        """
         try:
             # Get user's current level
             current_level = self.user.get("current_level", "beginner")
             
+            key = (self._graph_version, self.user.get("user_id"), current_level)
+            if key == self._path_cache_key:
+                return list(self._path_cache)
+                
             # Find starting node
             start_node = None
             for node in self.graph.nodes:
@@ -272,42 +410,27 @@ class QuantumAdaptiveSkillTree:
                 raise ValueError("No starting node found")
                 
             # Generate path using quantum-enhanced BFS
-            path = []
-            queue = [start_node]
-            visited = set()
-            
-            while queue:
-                node = queue.pop(0)
-                if node in visited:
-                    continue
-                    
-                # Check difficulty level
-                difficulty = self.graph.nodes[node].get("difficulty", 0.5)
-                
-                # Apply quantum state
-                state = self.quantum_teleporter.prepare_message(
-                    json.dumps({
-                        "node": node,
-                        "difficulty": difficulty,
-                        "current_level": current_level
-                    })
-                )
-                
-                # Apply quantum healing
-                healed = self.quantum_healer.heal_state(state)
-                
-                # Check if node should be included
-                if healed[0] > 0.5:  # Threshold for inclusion
-                    path.append(node)
-                    
-                # Add neighbors to queue
-                for neighbor in self.graph.neighbors(node):
-                    if neighbor not in visited:
-                        queue.append(neighbor)
-                        
-                visited.add(node)
-                
-            return path
+            order = list(nx.bfs_tree(self.graph, start_node))
+            payloads = [
+                json.dumps({
+                    "node": node,
+                    "difficulty": self.graph.nodes[node].get("difficulty", 0.5),
+                    "current_level": current_level
+                }, separators=(",", ":"))
+                for node in order
+            ]
+            
+            # Apply quantum healing to every visited node at once
+            healed = np.asarray(self.quantum_healer.heal_states(
+                self.quantum_teleporter.prepare_messages(payloads)
+            ))
+            
+            # Keep nodes above the inclusion threshold, in BFS order
+            included = healed[:, 0] > 0.5
+            path = [node for node, keep in zip(order, included) if keep]
+            
+            self._path_cache_key, self._path_cache = key, path
+            return list(path)
             
         except Exception as e:
             return []
@@ -170,6 +170,15 @@ class QuantumHealingCore:
         except Exception as e:
             return {"error": str(e)}
             
+    def heal_states(self, input_states):
+        """Heal a batch of quantum states.
+        
+        States are healed one at a time: heal_state records its results in
+        healed_states and error_patterns, and the backend is not assumed to
+        accept concurrent jobs.
+        """
+        return [self.heal_state(state) for state in input_states]
+            
     def get_healing_history(self, state):
         """Get healing history for a state."""
         history = []
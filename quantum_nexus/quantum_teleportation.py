@@ -68,6 +68,10 @@ class QuantumTeleportation:
         
         return qc
         
+    def prepare_messages(self, messages: List[str], encoding: str = 'binary') -> List[QuantumCircuit]:
+        """Convert a batch of messages to quantum states."""
+        return [self.prepare_message(message, encoding) for message in messages]
+        
     def _message_to_amplitudes(self, message: str) -> np.ndarray:
         """Convert message to quantum state amplitudes."""
         # Convert message to normalized amplitudes
@@ -0,0 +1,48 @@
+"""
+Tests for KubernetesClusterSetup
+"""
+
+import json
+import pytest
+from kubernetes import client
+from deployment.kubernetes import cluster_setup
+from deployment.kubernetes.cluster_setup import KubernetesClusterSetup
+from unittest.mock import MagicMock, patch
+
+class TestKubernetesClusterSetup:
+    """Test cases for KubernetesClusterSetup."""
+
+    @pytest.fixture
+    def cluster(self, monkeypatch):
+        """Cluster setup fixture that never loads real credentials."""
+        monkeypatch.setattr(cluster_setup, "_load_cluster_config", lambda: None)
+        return KubernetesClusterSetup({})
+
+    def test_apply_sends_object_body(self, cluster):
+        """Test that the apply PATCH body is a JSON object, not a string."""
+        namespace = client.V1Namespace(metadata=client.V1ObjectMeta(name="ns1"))
+
+        with patch.object(cluster.api_client, "request", return_value=MagicMock()) as request:
+            cluster.apply(namespace, "Namespace")
+
+        kwargs = request.call_args.kwargs
+        assert request.call_args.args[0] == "PATCH"
+        assert kwargs["headers"]["Content-Type"] == "application/apply-patch+yaml"
+        assert kwargs["body"] == {
+            "apiVersion": "v1",
+            "kind": "Namespace",
+            "metadata": {"name": "ns1"}
+        }
+
+    def test_apply_wire_body_is_object(self, cluster):
+        """Test that the encoded request body decodes to an object."""
+        namespace = client.V1Namespace(metadata=client.V1ObjectMeta(name="ns1"))
+        pool_manager = MagicMock()
+        pool_manager.request.return_value.status = 200
+        cluster.api_client.rest_client.pool_manager = pool_manager
+
+        cluster.apply(namespace, "Namespace")
+
+        sent = json.loads(pool_manager.request.call_args.kwargs["body"])
+        assert isinstance(sent, dict)
+        assert sent["metadata"]["name"] == "ns1"